@@ -0,0 +1,43 @@
+"""Store patent timestamps as timestamptz
+
+Revision ID: 002_patent_timestamps_tz
+Revises: 001_initial
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002_patent_timestamps_tz'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing values were written naive in UTC (datetime.utcnow)
+    for column in ('created_at', 'updated_at'):
+        op.alter_column(
+            'patents',
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.func.now(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    for column in ('created_at', 'updated_at'):
+        op.alter_column(
+            'patents',
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.func.now(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
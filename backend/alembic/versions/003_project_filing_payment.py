@@ -0,0 +1,38 @@
+"""Add project filing date / payment status and covering lookup index
+
+Revision ID: 003_project_filing_payment
+Revises: 002_patent_timestamps_tz
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_project_filing_payment'
+down_revision = '002_patent_timestamps_tz'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('projects', sa.Column('filing_date', sa.Date(), nullable=True))
+    op.add_column(
+        'projects',
+        sa.Column('payment_status', sa.String(20), nullable=False, server_default='unpaid')
+    )
+    
+    # CREATE INDEX ... INCLUDE (payment_status)
+    op.create_index(
+        'ix_projects_id_filing_date',
+        'projects',
+        ['id', 'filing_date'],
+        postgresql_include=['payment_status']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_projects_id_filing_date', table_name='projects')
+    op.drop_column('projects', 'payment_status')
+    op.drop_column('projects', 'filing_date')
@@ -0,0 +1,31 @@
+"""Replace the IVFFlat embedding index with HNSW
+
+Revision ID: 004_patents_embedding_hnsw
+Revises: 003_project_filing_payment
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '004_patents_embedding_hnsw'
+down_revision = '003_project_filing_payment'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS patents_embedding_idx')
+    op.execute(
+        'CREATE INDEX ix_patents_embedding_hnsw ON patents '
+        'USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_patents_embedding_hnsw')
+    op.execute(
+        'CREATE INDEX patents_embedding_idx ON patents '
+        'USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)'
+    )
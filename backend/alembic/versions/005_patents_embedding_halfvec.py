@@ -0,0 +1,41 @@
+"""Store patent embeddings as halfvec(384)
+
+Requires pgvector >= 0.7.0 on the PostgreSQL server.
+
+Revision ID: 005_patents_embedding_halfvec
+Revises: 004_patents_embedding_hnsw
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '005_patents_embedding_halfvec'
+down_revision = '004_patents_embedding_hnsw'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_patents_embedding_hnsw')
+    op.execute(
+        'ALTER TABLE patents ALTER COLUMN embedding '
+        'TYPE halfvec(384) USING embedding::halfvec(384)'
+    )
+    op.execute(
+        'CREATE INDEX ix_patents_embedding_hnsw ON patents '
+        'USING hnsw (embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_patents_embedding_hnsw')
+    op.execute(
+        'ALTER TABLE patents ALTER COLUMN embedding '
+        'TYPE vector(384) USING embedding::vector(384)'
+    )
+    op.execute(
+        'CREATE INDEX ix_patents_embedding_hnsw ON patents '
+        'USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)'
+    )
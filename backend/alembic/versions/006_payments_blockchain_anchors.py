@@ -0,0 +1,78 @@
+"""Create payments and blockchain_anchors tables
+
+Both tables already exist on databases initialised with create_all; they
+are only created when missing, and tagged with OWNER_COMMENT so that
+downgrade() only drops the tables this migration actually created.
+
+Revision ID: 006_payments_blockchain_anchors
+Revises: 005_patents_embedding_halfvec
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = '006_payments_blockchain_anchors'
+down_revision = '005_patents_embedding_halfvec'
+branch_labels = None
+depends_on = None
+
+OWNER_COMMENT = f'created by {revision}'
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    
+    if not inspector.has_table('payments'):
+        op.create_table(
+            'payments',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                'project_id', UUID(as_uuid=True), sa.ForeignKey('projects.id'), nullable=False
+            ),
+            sa.Column(
+                'user_id', UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=False
+            ),
+            sa.Column('stripe_session_id', sa.String(), nullable=False, unique=True),
+            sa.Column('stripe_payment_intent_id', sa.String(), nullable=True, unique=True),
+            sa.Column('amount', sa.Integer(), nullable=False),
+            sa.Column('currency', sa.String(3), nullable=True),
+            sa.Column('status', sa.String(20), nullable=False),
+            sa.Column('payment_method', sa.String(50), nullable=True),
+            sa.Column('receipt_url', sa.String(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            comment=OWNER_COMMENT,
+        )
+    
+    if not inspector.has_table('blockchain_anchors'):
+        op.create_table(
+            'blockchain_anchors',
+            sa.Column('id', UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                'project_id', UUID(as_uuid=True), sa.ForeignKey('projects.id'), nullable=False
+            ),
+            sa.Column('document_hash', sa.String(64), nullable=False),
+            sa.Column('woleet_anchor_id', sa.String(), nullable=False, unique=True),
+            sa.Column('status', sa.String(20), nullable=False),
+            sa.Column('tx_id', sa.String(), nullable=True),
+            sa.Column('block_height', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('confirmed_at', sa.DateTime(), nullable=True),
+            comment=OWNER_COMMENT,
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    
+    # Tables pre-existing from create_all are left in place
+    for table in ('blockchain_anchors', 'payments'):
+        if (
+            inspector.has_table(table)
+            and inspector.get_table_comment(table).get('text') == OWNER_COMMENT
+        ):
+            op.drop_table(table)
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 from typing import List, Union
+from functools import lru_cache
 
 
 class Settings(BaseSettings):
@@ -25,6 +26,24 @@ class Settings(BaseSettings):
         if v and v.startswith("postgresql://"):
             return v.replace("postgresql://", "postgresql+asyncpg://", 1)
         return v
+
+    # SQL statement logging (never enable in production). For targeted
+    # debugging prefer logging.getLogger("sqlalchemy.engine").setLevel("INFO").
+    SQL_ECHO: bool = False
+
+    # Database connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: int = 10  # seconds
+    DB_CONNECT_TIMEOUT: int = 5  # seconds
+    DB_COMMAND_TIMEOUT: int = 30  # seconds
+    DB_TCP_KEEPALIVES_IDLE: int = 60  # seconds
+    DB_TCP_KEEPALIVES_INTERVAL: int = 10  # seconds
+    DB_TCP_KEEPALIVES_COUNT: int = 5
+    DB_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy compiled statement cache
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg prepared statement cache
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False  # no prepared stmt caches / keepalive GUCs
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -88,6 +107,7 @@ class Settings(BaseSettings):
     CONTROLNET_LINE_ART_SCALE: float = 0.8
     SD_NUM_INFERENCE_STEPS: int = 30
     SD_GUIDANCE_SCALE: float = 7.5
+    SD_MAX_CONCURRENT_REQUESTS: int = 4  # concurrent calls to the SD provider
     
     # SAM2 Configuration
     SAM2_MODEL: str = "facebook/sam2-hiera-large"
@@ -99,7 +119,15 @@ class Settings(BaseSettings):
     POTRACE_TURNPOLICY: str = "minority"
     POTRACE_TURDSIZE: int = 2
     POTRACE_ALPHAMAX: float = 1.0
+    POTRACE_CONCURRENCY: int = 0  # max concurrent traces (0 = os.cpu_count())
     SVG_OPTIMIZE: bool = True
+    SVG_OPTIMIZE_MIN_BYTES: int = 10 * 1024  # smaller SVGs are returned as-is
+    
+    # Diagram uploads / results (stored in Redis)
+    SKETCH_UPLOAD_TTL: int = 600  # 10 minutes
+    SKETCH_UPLOAD_MAX_BYTES: int = 20 * 1024 * 1024  # 20 MB
+    DIAGRAM_RESULT_TTL: int = 3600  # 1 hour
+    DIAGRAM_CACHE_TTL: int = 86400  # content-addressed pipeline results, 24 hours
     
     # Annotation
     AUTO_LABEL_START_NUMBER: int = 10
@@ -131,5 +159,16 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the application settings, parsed once and reused.
+
+    Use as a FastAPI dependency (``Depends(get_settings)``); tests can reset
+    it with ``get_settings.cache_clear()``.
+    """
+    return Settings()
+
+
+# Global settings instance (kept for backward compatibility)
+settings = get_settings()
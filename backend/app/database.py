@@ -2,10 +2,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import text
 from typing import AsyncGenerator
-from app.config import settings
+import asyncio
+from app.config import get_settings
 
 
-# Create async engine
+settings = get_settings()
+
 # Create async engine
 # Ensure we use asyncpg
 db_url = settings.DATABASE_URL
@@ -14,11 +16,41 @@ if db_url and db_url.startswith("postgresql://"):
 elif db_url and db_url.startswith("postgres://"):
     db_url = db_url.replace("postgres://", "postgresql+asyncpg://", 1)
 
+# PgBouncer in transaction mode cannot keep prepared statements per client
+statement_cache_size = (
+    0 if settings.DB_PGBOUNCER_TRANSACTION_MODE else settings.DB_STATEMENT_CACHE_SIZE
+)
+
+server_settings = {"application_name": settings.APP_NAME}
+if not settings.DB_PGBOUNCER_TRANSACTION_MODE:
+    # asyncpg has no client-side keepalive options; set the server-side
+    # GUCs per session so silently dropped sockets are detected. They are
+    # sent as startup parameters, which PgBouncer rejects (unless listed in
+    # ignore_startup_parameters): behind PgBouncer use its tcp_keepalive_*.
+    server_settings.update({
+        "tcp_keepalives_idle": str(settings.DB_TCP_KEEPALIVES_IDLE),
+        "tcp_keepalives_interval": str(settings.DB_TCP_KEEPALIVES_INTERVAL),
+        "tcp_keepalives_count": str(settings.DB_TCP_KEEPALIVES_COUNT),
+    })
+
 engine = create_async_engine(
     db_url,
-    echo=settings.DEBUG,
+    echo=settings.SQL_ECHO,
+    echo_pool=False,
     future=True,
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": statement_cache_size,
+        "timeout": settings.DB_CONNECT_TIMEOUT,
+        "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        "server_settings": server_settings,
+    },
 )
 
 # Create async session factory
@@ -41,23 +73,67 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-async def init_db():
-    """Initialize database and create tables."""
+async def warm_connection_pool(n: int) -> None:
+    """Pre-establish n pooled connections so first requests skip the handshake."""
+    async def _warm():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*[_warm() for _ in range(n)])
+        logger.info(f"Database connection pool warmed with {n} connections")
+    except Exception as e:
+        logger.warning(f"Database connection pool warm-up failed: {e}")
+
+
+async def init_db() -> bool:
+    """
+    Initialize database and create tables.
+
+    Returns:
+        True if the pgvector extension is installed on the server.
+    """
     # Try to enable pgvector extension (requires pgvector to be installed on the DB server)
     async with engine.begin() as conn:
         try:
             await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-            logger.info("pgvector extension enabled")
         except Exception as e:
-            logger.warning(
-                f"pgvector extension not available: {e}. "
-                "Vector search features will be disabled. "
-                "Install pgvector on the PostgreSQL server to enable them."
-            )
+            logger.warning(f"Could not create pgvector extension: {e}")
 
-    # Create all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Probe once at startup so requests don't have to
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        )
+        pgvector_version = result.scalar_one_or_none()
+
+    if pgvector_version:
+        logger.info(f"pgvector extension enabled (version {pgvector_version})")
+        tables = None
+    else:
+        # Tables with VECTOR columns cannot be created without the extension
+        from app.models.patent import Embedding
+        tables = [
+            table for table in Base.metadata.sorted_tables
+            if not any(isinstance(col.type, Embedding) for col in table.columns)
+        ]
+        logger.warning(
+            "pgvector extension not available. "
+            "Vector search features will be disabled and tables with vector "
+            "columns will not be created. "
+            "Install pgvector on the PostgreSQL server to enable them."
+        )
+
+    # Create all tables in dev only; other environments are migrated by
+    # migrate.py (run by run_app.py before startup, or the compose migrate service)
+    if settings.ENVIRONMENT == "dev":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=tables)
+
+    # Open the pool's connections up front instead of on the first requests
+    await warm_connection_pool(settings.DB_POOL_SIZE)
+
+    return bool(pgvector_version)
 
 
 
@@ -72,3 +148,21 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only endpoints.
+
+    The transaction is opened with BEGIN READ ONLY (no extra round-trip):
+    any write fails loudly instead of being silently discarded, since the
+    session is never committed (closing it still issues a ROLLBACK).
+    Endpoints that may write must use get_db().
+    """
+    async with AsyncSessionLocal() as session:
+        await session.connection(execution_options={"postgresql_readonly": True})
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
@@ -1,4 +1,4 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -60,3 +60,12 @@ async def get_current_active_user(
 ) -> User:
     """Get current active user (alias for clarity)."""
     return current_user
+
+
+async def require_pgvector(request: Request) -> None:
+    """Reject vector search requests when pgvector was not found at startup."""
+    if not getattr(request.app.state, "pgvector_ok", False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Vector search unavailable: pgvector extension not installed"
+        )
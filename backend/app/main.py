@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
@@ -47,7 +48,7 @@ async def lifespan(app: FastAPI):
     
     try:
         # Initialize database and enable pgvector
-        await init_db()
+        app.state.pgvector_ok = await init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -102,6 +103,7 @@ app = FastAPI(
     openapi_tags=tags_metadata,
     lifespan=lifespan,
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
     contact={
         "name": "PatentFlow AI Support",
         "url": "https://patentflow.ai/support",
@@ -24,8 +24,9 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
         response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
         
-        # Remove server header
-        response.headers.pop("Server", None)
+        # Remove server header (MutableHeaders has no pop())
+        if "server" in response.headers:
+            del response.headers["server"]
         
         return response
 
@@ -1,19 +1,47 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index, Float, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-from datetime import datetime
+from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 from uuid import uuid4
 from app.database import Base
 
-# Try to import pgvector's Vector type; fall back to Text if not available
-try:
-    from pgvector.sqlalchemy import Vector
-    _VECTOR_TYPE = Vector(384)
-    PGVECTOR_AVAILABLE = True
-except Exception:
-    # pgvector not installed or extension unavailable — store embeddings as JSON text
-    _VECTOR_TYPE = Text
-    PGVECTOR_AVAILABLE = False
+
+class Embedding(TypeDecorator):
+    """
+    Embedding column type selected per dialect.
+
+    PostgreSQL stores HALFVEC(dim) through pgvector (imported lazily, only
+    when a PostgreSQL dialect compiles the type); other dialects (e.g. SQLite
+    in tests) store the vector as JSON.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    class Comparator(TypeDecorator.Comparator):
+        """pgvector distance operators, available without importing pgvector."""
+
+        def l2_distance(self, other):
+            return self.op("<->", return_type=Float)(other)
+
+        def max_inner_product(self, other):
+            return self.op("<#>", return_type=Float)(other)
+
+        def cosine_distance(self, other):
+            return self.op("<=>", return_type=Float)(other)
+
+    comparator_factory = Comparator
+
+    def __init__(self, dim: int = 384):
+        super().__init__()
+        self.dim = dim
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            from pgvector.sqlalchemy import HALFVEC
+            return dialect.type_descriptor(HALFVEC(self.dim))
+        return dialect.type_descriptor(JSON())
 
 
 class Patent(Base):
@@ -28,19 +56,38 @@ class Patent(Base):
     content = Column(Text, nullable=False)
     filing_date = Column(DateTime, nullable=True)
 
-    # Vector embedding for similarity search.
-    # Uses VECTOR(384) when pgvector is available, falls back to Text otherwise.
-    embedding = Column(_VECTOR_TYPE, nullable=True)
+    # Vector embedding for similarity search (requires pgvector >= 0.7 on PostgreSQL).
+    # Stored as fp16 halfvec: half the bytes of VECTOR for ANN scans.
+    embedding = Column(Embedding(384), nullable=True)
 
     # Foreign Keys
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
 
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Timestamps (computed by PostgreSQL, stored as UTC)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
 
     # Relationships
     project = relationship("Project", back_populates="patents")
 
+    # Fetch server-generated timestamps with RETURNING instead of a lazy reload
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # HNSW ANN index for cosine similarity search (<=>)
+        Index(
+            "ix_patents_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"}
+        ),
+    )
+
     def __repr__(self):
         return f"<Patent {self.patent_number or self.title}>"
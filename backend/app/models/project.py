@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Date, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
@@ -15,6 +15,10 @@ class Project(Base):
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     
+    # Filing and payment (read by annuity and blockchain routes)
+    filing_date = Column(Date, nullable=True)
+    payment_status = Column(String(20), default="unpaid", server_default="unpaid", nullable=False)
+    
     # Foreign Keys
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
@@ -25,6 +29,19 @@ class Project(Base):
     # Relationships
     user = relationship("User", back_populates="projects")
     patents = relationship("Patent", back_populates="project", cascade="all, delete-orphan")
+    payments = relationship("Payment", back_populates="project")
+    blockchain_anchors = relationship("BlockchainAnchor", back_populates="project")
+    
+    __table_args__ = (
+        # Covering index: annuity/blockchain lookups by id read filing_date and
+        # payment_status straight from the index (index-only scan)
+        Index(
+            "ix_projects_id_filing_date",
+            "id",
+            "filing_date",
+            postgresql_include=["payment_status"]
+        ),
+    )
     
     def __repr__(self):
         return f"<Project {self.name}>"
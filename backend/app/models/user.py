@@ -21,6 +21,7 @@ class User(Base):
     
     # Relationships
     projects = relationship("Project", back_populates="user", cascade="all, delete-orphan")
+    payments = relationship("Payment", back_populates="user")
     
     def __repr__(self):
         return f"<User {self.email}>"
@@ -1,10 +1,12 @@
 """API endpoints pour la génération IA de documents de brevet."""
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 import time
 import logging
-from typing import Dict
+from typing import Dict, List
 from uuid import UUID
 
 from app.database import get_db
@@ -24,6 +26,7 @@ from app.services.text_linter import patent_linter, PatentSection
 from app.models.generation_mode import GenerationMode
 from app.services.prompts.patent_engineer_prompts import MODE_CONFIGS
 from app.dependencies import get_current_user
+from app.utils.http_cache import STATIC_CACHE_HEADERS
 
 logger = logging.getLogger(__name__)
 
@@ -61,24 +64,26 @@ async def generate_patent_document(
         
         generation_time = int((time.time() - start_time) * 1000)
         
-        # Convertir validations en warnings
+        # Convertir validations en warnings (données internes: pas de revalidation)
         warnings = []
         if request.auto_lint and result.get('validations'):
-            for section_name, validation in result['validations'].items():
-                if hasattr(validation, 'issues'):
-                    for issue in validation.issues:
-                        warnings.append(ValidationIssue(
-                            section=section_name,
-                            severity="warning",
-                            message=issue,
-                            suggestion=None
-                        ))
+            warnings = [
+                ValidationIssue.model_construct(
+                    section=section_name,
+                    severity="warning",
+                    message=issue,
+                    suggestion=None
+                )
+                for section_name, validation in result['validations'].items()
+                if hasattr(validation, 'issues')
+                for issue in validation.issues
+            ]
         
         # Convertir quality_score
         quality_score_response = None
         if result.get('quality_score'):
             qs = result['quality_score']
-            quality_score_response = QualityScoreResponse(
+            quality_score_response = QualityScoreResponse.model_construct(
                 overall_score=qs.overall_score,
                 keyword_score=qs.keyword_score,
                 language_score=qs.language_score,
@@ -114,8 +119,9 @@ async def validate_patent_document(
     Retourne score de qualité, mots-clés manquants, et suggestions.
     """
     try:
-        # Exécuter linter sans auto-fix
-        lint_result = patent_linter.lint_document(
+        # Exécuter linter sans auto-fix (CPU: dans un thread pour ne pas bloquer la boucle)
+        lint_result = await asyncio.to_thread(
+            patent_linter.lint_document,
             title=request.title,
             abstract=request.abstract,
             description=request.description,
@@ -128,26 +134,13 @@ async def validate_patent_document(
         all_suggestions = []
         
         for section_name, validation in lint_result['validations'].items():
-            if hasattr(validation, 'issues'):
-                all_issues.extend([
-                    {
-                        'section': section_name,
-                        'message': issue
-                    }
-                    for issue in validation.issues
-                ])
-            if hasattr(validation, 'suggestions'):
-                all_suggestions.extend([
-                    {
-                        'section': section_name,
-                        'suggestion': sug
-                    }
-                    for sug in validation.suggestions
-                ])
+            for issue in getattr(validation, 'issues', ()):
+                all_issues.append({'section': section_name, 'message': issue})
+            for sug in getattr(validation, 'suggestions', ()):
+                all_suggestions.append({'section': section_name, 'suggestion': sug})
         
-        # Trouver adjectifs non-techniques
-        full_text = f"{request.title} {request.abstract} {request.description} {request.claims}"
-        non_tech_adjs = patent_linter.find_non_technical_adjectives(full_text)
+        # Adjectifs non-techniques (calculés une seule fois par le linter)
+        non_tech_adjs = lint_result['non_technical_adjectives']
         
         qs = lint_result['quality_score']
         
@@ -225,47 +218,50 @@ async def generate_section(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Cas d'usage par mode (table précalculée au chargement du module)
+_MODE_USE_CASES: Dict[GenerationMode, List[str]] = {
+    GenerationMode.LARGE: [
+        "Protection juridique maximale",
+        "Couvrir toutes les variantes possibles",
+        "Revendications larges et génériques",
+        "Dépôt initial avec scope maximum"
+    ],
+    GenerationMode.TECHNIQUE: [
+        "Documentation technique complète",
+        "Détails d'implémentation précis",
+        "Description reproductible",
+        "Paramètres et algorithmes détaillés"
+    ],
+    GenerationMode.INPI_COMPLIANCE: [
+        "Dépôt INPI français",
+        "Format strictement conforme",
+        "Numérotation [0001]...",
+        "Prêt pour soumission officielle"
+    ],
+}
+
+# Liste des modes construite une seule fois (contenu constant)
+_MODES_RESPONSE = ModesListResponse(modes=[
+    ModeInfo(
+        mode=mode.value,
+        name=mode.value.replace('_', ' ').title(),
+        description=config['description'],
+        temperature=config['temperature'],
+        use_cases=_MODE_USE_CASES.get(mode, [])
+    )
+    for mode, config in MODE_CONFIGS.items()
+]).model_dump(mode="json")
+
+
 @router.get("/modes", response_model=ModesListResponse)
 async def list_generation_modes():
     """
     Liste tous les modes de génération disponibles avec leurs descriptions.
     """
-    modes = []
-    
-    for mode, config in MODE_CONFIGS.items():
-        use_cases = []
-        
-        if mode == GenerationMode.LARGE:
-            use_cases = [
-                "Protection juridique maximale",
-                "Couvrir toutes les variantes possibles",
-                "Revendications larges et génériques",
-                "Dépôt initial avec scope maximum"
-            ]
-        elif mode == GenerationMode.TECHNIQUE:
-            use_cases = [
-                "Documentation technique complète",
-                "Détails d'implémentation précis",
-                "Description reproductible",
-                "Paramètres et algorithmes détaillés"
-            ]
-        elif mode == GenerationMode.INPI_COMPLIANCE:
-            use_cases = [
-                "Dépôt INPI français",
-                "Format strictement conforme",
-                "Numérotation [0001]...",
-                "Prêt pour soumission officielle"
-            ]
-        
-        modes.append(ModeInfo(
-            mode=mode.value,
-            name=mode.value.replace('_', ' ').title(),
-            description=config['description'],
-            temperature=config['temperature'],
-            use_cases=use_cases
-        ))
-    
-    return ModesListResponse(modes=modes)
+    return ORJSONResponse(
+        content=_MODES_RESPONSE,
+        headers=STATIC_CACHE_HEADERS
+    )
 
 
 @router.get("/health")
@@ -4,10 +4,12 @@ Routes API pour annuités INPI.
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi.responses import ORJSONResponse
+from functools import lru_cache
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.database import get_db
+from app.database import get_db_ro
 from app.dependencies import get_current_user
 from app.schemas.transactional import (
     AnnuityScheduleResponse,
@@ -18,7 +20,7 @@ from app.schemas.transactional import (
 )
 from app.services.inpi_calculator_service import inpi_calculator
 from app.models.project import Project
-from sqlalchemy import select
+from app.utils.http_cache import STATIC_CACHE_HEADERS
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,22 @@ router = APIRouter(
 )
 
 
+@lru_cache(maxsize=32)
+def _total_costs_response(years: int) -> dict:
+    """Coûts totaux sur N années (ne dépend que de years)."""
+    costs = inpi_calculator.calculate_total_costs(years=years)
+    return AnnuityCostsResponse(**costs).model_dump(mode="json")
+
+
+@lru_cache(maxsize=1)
+def _rates_table_response() -> dict:
+    """Tableau des tarifs INPI (constant)."""
+    rates = inpi_calculator.get_rates_table()
+    return AnnuityRatesResponse(
+        rates=[AnnuityRate(**rate) for rate in rates]
+    ).model_dump(mode="json")
+
+
 @router.get(
     "/schedule/{project_id}",
     response_model=AnnuityScheduleResponse,
@@ -36,16 +54,13 @@ router = APIRouter(
 async def get_annuity_schedule(
     project_id: UUID,
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Retourne le calendrier complet des annuités INPI (20 ans).
     """
     # Get project
-    result = await db.execute(
-        select(Project).where(Project.id == project_id)
-    )
-    project = result.scalar_one_or_none()
+    project = await db.get(Project, project_id)
     
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -85,8 +100,10 @@ async def get_total_costs(
     - Coûts cumulatifs par année
     """
     try:
-        costs = inpi_calculator.calculate_total_costs(years=years)
-        return AnnuityCostsResponse(**costs)
+        return ORJSONResponse(
+            content=_total_costs_response(years),
+            headers=STATIC_CACHE_HEADERS
+        )
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -101,7 +118,7 @@ async def get_upcoming_payments(
     project_id: UUID,
     months_ahead: int = Query(default=6, ge=1, le=24, description="Months ahead"),
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Retourne les paiements d'annuités à venir.
@@ -126,10 +143,9 @@ async def get_rates_table():
     """
     Retourne le tableau complet des tarifs INPI officiels 2024.
     """
-    rates = inpi_calculator.get_rates_table()
-    
-    return AnnuityRatesResponse(
-        rates=[AnnuityRate(**rate) for rate in rates]
+    return ORJSONResponse(
+        content=_rates_table_response(),
+        headers=STATIC_CACHE_HEADERS
     )
 
 
@@ -141,16 +157,13 @@ async def get_payment_for_year(
     project_id: UUID,
     year: int = Path(..., ge=1, le=20, description="Year (1-20)"),
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Retourne les détails d'un paiement pour une année spécifique.
     """
     # Get project
-    result = await db.execute(
-        select(Project).where(Project.id == project_id)
-    )
-    project = result.scalar_one_or_none()
+    project = await db.get(Project, project_id)
     
     if not project or not project.filing_date:
         raise HTTPException(status_code=404, detail="Project not found")
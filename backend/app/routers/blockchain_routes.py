@@ -2,12 +2,15 @@
 Routes API pour blockchain et preuves d'antériorité.
 """
 
+import hmac
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.database import get_db
+from app.config import Settings, get_settings
+from app.database import get_db, get_db_ro
 from app.dependencies import get_current_user
 from app.schemas.transactional import (
     AnchorRequest,
@@ -16,7 +19,6 @@ from app.schemas.transactional import (
 )
 from app.services.blockchain_service import blockchain_service
 from app.models.project import Project
-from sqlalchemy import select
 
 logger = logging.getLogger(__name__)
 
@@ -42,10 +44,7 @@ async def anchor_document(
     **Requires**: Le projet doit être payé.
     """
     # Verify project exists and is paid
-    result = await db.execute(
-        select(Project).where(Project.id == request.project_id)
-    )
-    project = result.scalar_one_or_none()
+    project = await db.get(Project, request.project_id)
     
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -83,6 +82,7 @@ async def verify_anchor(
     Vérifie le statut d'un ancrage blockchain.
     
     Retourne le statut, transaction Bitcoin, et lien de preuve.
+    (Session en écriture : le statut confirmé est enregistré.)
     """
     try:
         verification = await blockchain_service.verify_anchor(
@@ -106,7 +106,7 @@ async def verify_anchor(
 async def download_certificate(
     anchor_id: UUID,
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Télécharge le certificat PDF de preuve d'antériorité.
@@ -114,13 +114,13 @@ async def download_certificate(
     **Requires**: L'ancrage doit être confirmé sur la blockchain.
     """
     try:
-        pdf = await blockchain_service.generate_proof_certificate(
+        pdf_chunks = await blockchain_service.generate_proof_certificate(
             anchor_id=anchor_id,
             db=db
         )
         
-        return Response(
-            content=pdf,
+        return StreamingResponse(
+            pdf_chunks,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename=proof_{anchor_id}.pdf"
@@ -155,6 +155,28 @@ async def calculate_hash(
     }
 
 
+@router.post(
+    "/calculate-hash/file",
+    status_code=status.HTTP_200_OK
+)
+async def calculate_file_hash(
+    file: UploadFile = File(...),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Calcule le hash SHA-256 d'un fichier uploadé.
+    
+    Le fichier est haché par blocs, sans être chargé entièrement en mémoire.
+    Adapté aux documents volumineux.
+    """
+    doc_hash = await blockchain_service.calculate_file_hash(file)
+    
+    return {
+        "hash": doc_hash,
+        "algorithm": "SHA-256"
+    }
+
+
 @router.post(
     "/verify-hash",
     status_code=status.HTTP_200_OK
@@ -167,12 +189,15 @@ async def verify_hash(
     """
     Vérifie qu'un contenu correspond à un hash.
     """
-    is_valid = blockchain_service.verify_hash(content, expected_hash)
+    # Un seul calcul du hash, comparaison en temps constant (sur bytes :
+    # compare_digest refuse les str non-ASCII)
+    actual_hash = blockchain_service.calculate_hash(content)
+    is_valid = hmac.compare_digest(actual_hash.encode(), expected_hash.encode())
     
     return {
         "valid": is_valid,
         "expected_hash": expected_hash,
-        "actual_hash": blockchain_service.calculate_hash(content)
+        "actual_hash": actual_hash
     }
 
 
@@ -180,12 +205,10 @@ async def verify_hash(
     "/health",
     status_code=status.HTTP_200_OK
 )
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """
     Vérifie la santé du service blockchain.
     """
-    from app.config import settings
-    
     return {
         "status": "ok",
         "message": "Blockchain service ready",
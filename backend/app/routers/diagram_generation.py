@@ -4,17 +4,24 @@ SDXL + ControlNet → Potrace → SAM2 → Annotation.
 """
 
 import logging
-import base64
 import io
+import time
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
+import msgpack
+import orjson
+import pybase64
+from blake3 import blake3
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import Settings, get_settings
 from app.database import get_db
 from app.schemas.image_processing import (
     DiagramGenerationRequest,
     DiagramGenerationResponse,
+    SketchUploadResponse,
     VectorizationRequest,
     VectorizationResponse,
     AnnotationRequest,
@@ -22,9 +29,11 @@ from app.schemas.image_processing import (
     DiagramTypesResponse,
     DiagramTypeInfo
 )
+from app.services.cache_service import cache_service
 from app.services.diagram_pipeline_service import diagram_pipeline
 from app.services.image_generator_service import TECHNICAL_DIAGRAM_PROMPTS
 from app.dependencies import get_current_user
+from app.utils.http_cache import STATIC_CACHE_HEADERS
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +42,56 @@ router = APIRouter(
     tags=["Diagram Generation"]
 )
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def _sketch_upload_key(upload_id: UUID) -> str:
+    return f"sketch:{upload_id}"
+
+
+def _diagram_result_key(owner_id: str, image_id: UUID) -> str:
+    # Image liée au compte qui l'a générée
+    return f"diagram:image:{owner_id}:{image_id}"
+
+
+def _diagram_cache_key(sketch_digest: bytes, request: DiagramGenerationRequest) -> str:
+    """Clé adressée par contenu : BLAKE3(digest BLAKE3 du croquis + paramètres canoniques)."""
+    params = orjson.dumps(
+        {
+            "diagram_type": request.diagram_type,
+            "auto_annotate": request.auto_annotate,
+            "start_number": request.start_number,
+            "number_increment": request.number_increment,
+            "controlnet_strength": request.controlnet_strength,
+            "add_leader_lines": request.add_leader_lines,
+            "custom_prompt": request.custom_prompt,
+        },
+        option=orjson.OPT_SORT_KEYS
+    )
+    hasher = blake3(sketch_digest)
+    hasher.update(params)
+    return f"diagram:result:{hasher.hexdigest()}"
+
+
+def _component_fields(component: dict) -> dict:
+    """Champs ComponentInfo en int natifs (OpenCV/SAM2 renvoient floats et scalaires numpy)."""
+    return {
+        'id': int(component['id']),
+        'bbox': [int(v) for v in component['bbox']],
+        'area': int(component['area']),
+        'type': component.get('type', 'unknown')
+    }
+
+
+def _label_fields(label: dict) -> dict:
+    """Champs LabelInfo en int natifs (model_construct ne convertit pas)."""
+    return {
+        'number': int(label['number']),
+        'position': [int(v) for v in label['position']],
+        'component_id': int(label['component_id']),
+        'has_leader_line': bool(label.get('has_leader_line', False))
+    }
+
 
 @router.post(
     "/generate",
@@ -42,7 +101,8 @@ router = APIRouter(
 async def generate_diagram(
     request: DiagramGenerationRequest,
     current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Génère un schéma technique annoté depuis un croquis.
@@ -65,35 +125,90 @@ async def generate_diagram(
             f"type={request.diagram_type}"
         )
         
-        # Decode base64 sketch image
-        try:
-            sketch_bytes = base64.b64decode(request.sketch_image)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid base64 image: {str(e)}"
+        if request.sketch_upload_id is not None:
+            # Sketch uploadé via /upload/stream : bytes bruts, usage unique
+            sketch_bytes = await cache_service.get_bytes(
+                _sketch_upload_key(request.sketch_upload_id),
+                delete=True
             )
+            if sketch_bytes is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Sketch upload not found or expired"
+                )
+        else:
+            # Decode base64 sketch image
+            try:
+                sketch_bytes = pybase64.b64decode(request.sketch_image, validate=False)
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid base64 image: {str(e)}"
+                )
         
-        # Process through pipeline
-        result = await diagram_pipeline.process_sketch(
-            sketch_bytes=sketch_bytes,
-            diagram_type=request.diagram_type,
-            auto_annotate=request.auto_annotate,
-            start_number=request.start_number,
-            number_increment=request.number_increment,
-            controlnet_strength=request.controlnet_strength,
-            add_leader_lines=request.add_leader_lines,
-            custom_prompt=request.custom_prompt
-        )
+        # Résultat déjà calculé pour ce croquis + ces paramètres ?
+        lookup_start = time.perf_counter()
+        # Digest unique du croquis : clé de cache et clé de coalescence
+        sketch_digest = blake3(sketch_bytes).digest()
+        cache_key = _diagram_cache_key(sketch_digest, request)
+        cached = await cache_service.get_bytes(cache_key)
+        
+        if cached is not None:
+            result = msgpack.unpackb(cached)
+            result['processing_time_ms'] = int((time.perf_counter() - lookup_start) * 1000)
+            logger.info(f"Diagram result cache hit: {cache_key}")
+        else:
+            # Process through pipeline
+            result = await diagram_pipeline.process_sketch(
+                sketch_bytes=sketch_bytes,
+                diagram_type=request.diagram_type,
+                auto_annotate=request.auto_annotate,
+                start_number=request.start_number,
+                number_increment=request.number_increment,
+                controlnet_strength=request.controlnet_strength,
+                add_leader_lines=request.add_leader_lines,
+                custom_prompt=request.custom_prompt,
+                sketch_digest=sketch_digest
+            )
+            # model_construct ne valide pas : types natifs avant cache et réponse
+            result['components'] = [_component_fields(c) for c in result['components']]
+            result['labels'] = [_label_fields(label) for label in result['labels']]
+            
+            try:
+                packed = msgpack.packb({
+                    'svg_content': result['svg_content'],
+                    'diagram_image': result['diagram_image'],
+                    'components': result['components'],
+                    'labels': result['labels'],
+                    'auto_annotated': result['auto_annotated'],
+                    'quality_metrics': result.get('quality_metrics', {})
+                })
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Diagram result not cacheable: {e}")
+            else:
+                await cache_service.set_bytes(cache_key, packed, ttl=settings.DIAGRAM_CACHE_TTL)
         
-        # Encode diagram image to base64 for response
-        diagram_b64 = base64.b64encode(result['diagram_image']).decode('utf-8')
-        diagram_url = f"data:image/png;base64,{diagram_b64}"
+        diagram_url = None
+        if request.return_image_url:
+            # Stocke le PNG et retourne une URL courte au lieu d'une data URL
+            image_id = uuid4()
+            if await cache_service.set_bytes(
+                _diagram_result_key(current_user.get('id'), image_id),
+                result['diagram_image'],
+                ttl=settings.DIAGRAM_RESULT_TTL
+            ):
+                diagram_url = f"{router.prefix}/result/{image_id}.png"
+        
+        if diagram_url is None:
+            # Encode diagram image to base64 for response
+            diagram_b64 = pybase64.b64encode_as_string(result['diagram_image'])
+            diagram_url = f"data:image/png;base64,{diagram_b64}"
         
         # TODO: Save to database and file storage
         # For now, return inline
         
-        response = DiagramGenerationResponse(
+        # Champs construits côté serveur : pas de revalidation Pydantic
+        response = DiagramGenerationResponse.model_construct(
             diagram_id=None,  # TODO: Generate and save
             svg_content=result['svg_content'],
             diagram_image_url=diagram_url,
@@ -110,7 +225,8 @@ async def generate_diagram(
             f"{len(result['labels'])} labels"
         )
         
-        return response
+        # Réponse retournée directement : FastAPI ne revalide pas response_model
+        return ORJSONResponse(dict(response))
         
     except HTTPException:
         raise
@@ -142,7 +258,7 @@ async def vectorize_image(
         
         # Decode base64 image
         try:
-            image_bytes = base64.b64decode(request.image)
+            image_bytes = pybase64.b64decode(request.image, validate=False)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -150,16 +266,16 @@ async def vectorize_image(
             )
         
         # Vectorize
-        svg_content = await diagram_pipeline.vectorize_only(
+        svg_content, optimization_applied = await diagram_pipeline.vectorize_only(
             image_bytes=image_bytes,
             threshold=request.threshold,
             optimize=request.optimize
         )
         
-        return VectorizationResponse(
+        return ORJSONResponse(dict(VectorizationResponse.model_construct(
             svg_content=svg_content,
-            optimization_applied=request.optimize
-        )
+            optimization_applied=optimization_applied
+        )))
         
     except HTTPException:
         raise
@@ -191,7 +307,7 @@ async def annotate_svg(
         
         # Decode reference image
         try:
-            reference_bytes = base64.b64decode(request.reference_image)
+            reference_bytes = pybase64.b64decode(request.reference_image, validate=False)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -207,11 +323,11 @@ async def annotate_svg(
             add_leader_lines=request.add_leader_lines
         )
         
-        return AnnotationResponse(
+        return ORJSONResponse(dict(AnnotationResponse.model_construct(
             svg_content=result['svg_content'],
-            labels=result['labels'],
-            num_components=result['num_components']
-        )
+            labels=[_label_fields(label) for label in result['labels']],
+            num_components=int(result['num_components'])
+        )))
         
     except HTTPException:
         raise
@@ -223,37 +339,79 @@ async def annotate_svg(
         )
 
 
+async def _read_sketch_upload(file: UploadFile, settings: Settings) -> bytearray:
+    """Lit l'upload image par blocs de 1 Mo en bornant la taille (413 au-delà)."""
+    if not file.content_type or not file.content_type.startswith('image/'):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be an image"
+        )
+    
+    buffer = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        if len(buffer) + len(chunk) > settings.SKETCH_UPLOAD_MAX_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File exceeds {settings.SKETCH_UPLOAD_MAX_BYTES} bytes"
+            )
+        buffer += chunk
+    return buffer
+
+
+async def _store_sketch_upload(file: UploadFile, settings: Settings) -> SketchUploadResponse:
+    """
+    Lit l'upload par blocs de 1 Mo et stocke les bytes bruts dans Redis
+    sous sketch:{upload_id} (usage unique).
+    """
+    buffer = await _read_sketch_upload(file, settings)
+    
+    upload_id = uuid4()
+    stored = await cache_service.set_bytes(
+        _sketch_upload_key(upload_id),
+        buffer,
+        ttl=settings.SKETCH_UPLOAD_TTL
+    )
+    if not stored:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Upload storage unavailable"
+        )
+    
+    return SketchUploadResponse(
+        upload_id=upload_id,
+        filename=file.filename,
+        content_type=file.content_type,
+        size_bytes=len(buffer),
+        sha=blake3(buffer).hexdigest(),
+        expires_in=settings.SKETCH_UPLOAD_TTL
+    )
+
+
 @router.post(
     "/upload",
-    status_code=status.HTTP_200_OK
+    status_code=status.HTTP_200_OK,
+    deprecated=True
 )
 async def upload_sketch(
     file: UploadFile = File(...),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Upload un fichier image (alternative à base64).
     Retourne l'image encodée en base64 pour utiliser avec /generate.
+    
+    **Déprécié** : utiliser /upload/stream, qui retourne un upload_id
+    (sketch_upload_id de /generate) sans aller-retour base64.
     """
     try:
-        # Validate file type
-        if not file.content_type.startswith('image/'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File must be an image"
-            )
-        
-        # Read file
-        contents = await file.read()
-        
-        # Encode to base64
-        b64_image = base64.b64encode(contents).decode('utf-8')
+        contents = await _read_sketch_upload(file, settings)
         
         return {
             "filename": file.filename,
             "content_type": file.content_type,
             "size_bytes": len(contents),
-            "base64_image": b64_image
+            "base64_image": pybase64.b64encode_as_string(contents)
         }
         
     except HTTPException:
@@ -266,6 +424,123 @@ async def upload_sketch(
         )
 
 
+@router.post(
+    "/upload/stream",
+    response_model=SketchUploadResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def upload_sketch_stream(
+    file: UploadFile = File(...),
+    current_user: dict = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
+):
+    """
+    Upload un croquis et retourne un upload_id à passer à /generate
+    (sketch_upload_id), sans aller-retour base64.
+    
+    Le fichier est lu par blocs de 1 Mo et stocké dans Redis
+    (clé sketch:{upload_id}, TTL 10 min, usage unique).
+    """
+    return await _store_sketch_upload(file, settings)
+
+
+@router.get(
+    "/result/{image_id}.png",
+    response_class=Response,
+    status_code=status.HTTP_200_OK
+)
+async def get_diagram_result(
+    image_id: UUID,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Sert l'image PNG d'un schéma généré avec return_image_url=True.
+    
+    Authentifié comme /generate : seul le compte qui a généré le schéma
+    peut le récupérer (404 sinon), jusqu'à expiration (DIAGRAM_RESULT_TTL).
+    """
+    image = await cache_service.get_bytes(
+        _diagram_result_key(current_user.get('id'), image_id)
+    )
+    if image is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Diagram image not found or expired"
+        )
+    
+    return Response(
+        content=image,
+        media_type="image/png",
+        headers={"Cache-Control": "private, max-age=3600"}
+    )
+
+
+# Descriptions des types de schémas (contenu constant)
+_TYPE_DESCRIPTIONS = {
+    "mechanical": {
+        "name": "Mechanical",
+        "description": "Schémas mécaniques (machines, mécanismes, pièces)",
+        "use_cases": [
+            "Machines et mécanismes",
+            "Pièces mécaniques",
+            "Assemblages",
+            "Systèmes de transmission"
+        ]
+    },
+    "electrical": {
+        "name": "Electrical",
+        "description": "Circuits et schémas électriques/électroniques",
+        "use_cases": [
+            "Circuits électroniques",
+            "Schémas de câblage",
+            "Diagrammes de circuits",
+            "Systèmes électriques"
+        ]
+    },
+    "chemical": {
+        "name": "Chemical",
+        "description": "Procédés chimiques et industriels",
+        "use_cases": [
+            "Procédés chimiques",
+            "Diagrammes de flux",
+            "Équipements industriels",
+            "Systèmes de traitement"
+        ]
+    },
+    "software": {
+        "name": "Software",
+        "description": "Architectures logicielles et systèmes",
+        "use_cases": [
+            "Architectures logicielles",
+            "Diagrammes UML",
+            "Systèmes informatiques",
+            "Flux de données"
+        ]
+    },
+    "generic": {
+        "name": "Generic",
+        "description": "Schéma technique générique",
+        "use_cases": [
+            "Schémas techniques généraux",
+            "Illustrations de brevets",
+            "Diagrammes personnalisés"
+        ]
+    }
+}
+
+# Réponse /types sérialisée une seule fois au chargement du module
+_DIAGRAM_TYPES_RESPONSE_BYTES = orjson.dumps(DiagramTypesResponse(types=[
+    DiagramTypeInfo(
+        type=diagram_type,
+        name=_TYPE_DESCRIPTIONS.get(diagram_type, {}).get("name", diagram_type.capitalize()),
+        description=_TYPE_DESCRIPTIONS.get(diagram_type, {}).get("description", ""),
+        optimal_use_cases=_TYPE_DESCRIPTIONS.get(diagram_type, {}).get("use_cases", []),
+        example_prompt=prompt
+    )
+    for diagram_type, prompt in TECHNICAL_DIAGRAM_PROMPTS.items()
+]).model_dump(mode="json"))
+
+
 @router.get(
     "/types",
     response_model=DiagramTypesResponse,
@@ -276,84 +551,21 @@ async def get_diagram_types():
     Liste tous les types de schémas disponibles.
     Retourne les prompts optimisés pour chaque type.
     """
-    types = []
-    
-    type_descriptions = {
-        "mechanical": {
-            "name": "Mechanical",
-            "description": "Schémas mécaniques (machines, mécanismes, pièces)",
-            "use_cases": [
-                "Machines et mécanismes",
-                "Pièces mécaniques",
-                "Assemblages",
-                "Systèmes de transmission"
-            ]
-        },
-        "electrical": {
-            "name": "Electrical",
-            "description": "Circuits et schémas électriques/électroniques",
-            "use_cases": [
-                "Circuits électroniques",
-                "Schémas de câblage",
-                "Diagrammes de circuits",
-                "Systèmes électriques"
-            ]
-        },
-        "chemical": {
-            "name": "Chemical",
-            "description": "Procédés chimiques et industriels",
-            "use_cases": [
-                "Procédés chimiques",
-                "Diagrammes de flux",
-                "Équipements industriels",
-                "Systèmes de traitement"
-            ]
-        },
-        "software": {
-            "name": "Software",
-            "description": "Architectures logicielles et systèmes",
-            "use_cases": [
-                "Architectures logicielles",
-                "Diagrammes UML",
-                "Systèmes informatiques",
-                "Flux de données"
-            ]
-        },
-        "generic": {
-            "name": "Generic",
-            "description": "Schéma technique générique",
-            "use_cases": [
-                "Schémas techniques généraux",
-                "Illustrations de brevets",
-                "Diagrammes personnalisés"
-            ]
-        }
-    }
-    
-    for diagram_type, prompt in TECHNICAL_DIAGRAM_PROMPTS.items():
-        info = type_descriptions.get(diagram_type, {})
-        
-        types.append(DiagramTypeInfo(
-            type=diagram_type,
-            name=info.get("name", diagram_type.capitalize()),
-            description=info.get("description", ""),
-            optimal_use_cases=info.get("use_cases", []),
-            example_prompt=prompt
-        ))
-    
-    return DiagramTypesResponse(types=types)
+    return Response(
+        content=_DIAGRAM_TYPES_RESPONSE_BYTES,
+        media_type="application/json",
+        headers=STATIC_CACHE_HEADERS
+    )
 
 
 @router.get(
     "/health",
     status_code=status.HTTP_200_OK
 )
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """
     Vérifie l'état du service de génération de schémas.
     """
-    from app.config import settings
-    
     return {
         "status": "ok",
         "message": "Diagram generation service ready",
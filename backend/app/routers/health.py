@@ -1,8 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from app.database import get_db, engine
-from app.config import settings
+from app.config import Settings, get_settings
 import redis.asyncio as redis
 
 
@@ -10,7 +10,7 @@ router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """
     Health check endpoint.
     Verifies database and Redis connectivity.
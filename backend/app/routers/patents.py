@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated, List
 from uuid import UUID
 from app.database import get_db
-from app.dependencies import get_current_active_user
+from app.dependencies import get_current_active_user, require_pgvector
 from app.models.user import User
 from app.schemas.patent import (
     PatentCreate,
@@ -107,7 +107,11 @@ async def delete_patent_by_id(
         )
 
 
-@router.post("/search", response_model=List[PatentSearchResult])
+@router.post(
+    "/search",
+    response_model=List[PatentSearchResult],
+    dependencies=[Depends(require_pgvector)]
+)
 async def search_patents(
     search_query: PatentSearchQuery,
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -131,7 +135,11 @@ async def search_patents(
     ]
 
 
-@router.post("/search/top5", response_model=List[PatentSearchResult])
+@router.post(
+    "/search/top5",
+    response_model=List[PatentSearchResult],
+    dependencies=[Depends(require_pgvector)]
+)
 async def search_top_5_similar_patents(
     search_query: PatentSearchQuery,
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -3,10 +3,13 @@ Routes API pour paiements Stripe.
 """
 
 import logging
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
+from app.config import Settings, get_settings
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.schemas.transactional import (
@@ -16,6 +19,7 @@ from app.schemas.transactional import (
     PricingResponse
 )
 from app.services.stripe_service import stripe_service
+from app.utils.http_cache import STATIC_CACHE_HEADERS
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,11 @@ router = APIRouter(
     tags=["Payments"]
 )
 
+# Tarifs constants par déploiement : sérialisés une seule fois
+_PRICING_RESPONSE_BYTES = orjson.dumps(
+    PricingResponse(**stripe_service.get_pricing_info()).model_dump(mode="json")
+)
+
 
 @router.post(
     "/create-checkout",
@@ -114,9 +123,9 @@ async def get_payment_status(
     )
     
     if not payment_status:
-        return PaymentStatusResponse(status='unpaid')
+        return ORJSONResponse(dict(PaymentStatusResponse.model_construct(status='unpaid')))
     
-    return PaymentStatusResponse(**payment_status)
+    return ORJSONResponse(dict(PaymentStatusResponse.model_construct(**payment_status)))
 
 
 @router.get(
@@ -128,20 +137,21 @@ async def get_pricing():
     """
     Retourne les informations de tarification.
     """
-    pricing = stripe_service.get_pricing_info()
-    return PricingResponse(**pricing)
+    return Response(
+        content=_PRICING_RESPONSE_BYTES,
+        media_type="application/json",
+        headers=STATIC_CACHE_HEADERS
+    )
 
 
 @router.get(
     "/health",
     status_code=status.HTTP_200_OK
 )
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """
     Vérifie la santé du service de paiement.
     """
-    from app.config import settings
-    
     return {
         "status": "ok",
         "message": "Payment service ready",
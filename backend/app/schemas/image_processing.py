@@ -3,7 +3,7 @@ Pydantic schemas pour traitement d'images et génération de schémas.
 """
 
 from typing import List, Optional, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from uuid import UUID
 
 
@@ -26,11 +26,16 @@ class LabelInfo(BaseModel):
 class DiagramGenerationRequest(BaseModel):
     """Requête de génération de schéma technique."""
     
-    sketch_image: str = Field(
-        ...,
+    sketch_image: Optional[str] = Field(
+        default=None,
         description="Image du croquis encodée en base64"
     )
     
+    sketch_upload_id: Optional[UUID] = Field(
+        default=None,
+        description="ID retourné par /upload/stream (alternative à sketch_image)"
+    )
+    
     diagram_type: str = Field(
         default="generic",
         pattern="^(mechanical|electrical|chemical|software|generic)$",
@@ -78,6 +83,17 @@ class DiagramGenerationRequest(BaseModel):
         default=None,
         description="ID du projet associé (optionnel)"
     )
+    
+    return_image_url: bool = Field(
+        default=False,
+        description="Retourner une URL /result/{id}.png au lieu d'une data URL base64"
+    )
+    
+    @model_validator(mode="after")
+    def check_sketch_source(self) -> "DiagramGenerationRequest":
+        if (self.sketch_image is None) == (self.sketch_upload_id is None):
+            raise ValueError("Provide exactly one of sketch_image or sketch_upload_id")
+        return self
 
 
 class DiagramGenerationResponse(BaseModel):
@@ -99,6 +115,17 @@ class DiagramGenerationResponse(BaseModel):
     )
 
 
+class SketchUploadResponse(BaseModel):
+    """Réponse d'upload de croquis (référence courte durée)."""
+    
+    upload_id: UUID
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+    size_bytes: int
+    sha: Optional[str] = Field(default=None, description="Empreinte BLAKE3 (hex) du fichier")
+    expires_in: int = Field(..., description="Durée de validité en secondes")
+
+
 class VectorizationRequest(BaseModel):
     """Requête de vectorisation seule."""
     
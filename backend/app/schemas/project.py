@@ -5,12 +5,10 @@ from typing import Optional, List
 from app.utils.validators import sanitize_string
 
 
-class ProjectBase(BaseModel):
-    """Base schema for Project."""
-    name: str = Field(..., min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=1000)
+class ProjectSanitizeMixin(BaseModel):
+    """Shared sanitization of the project text fields."""
     
-    @field_validator('name', 'description')
+    @field_validator('name', 'description', check_fields=False)
     @classmethod
     def sanitize_fields(cls, v):
         if v is not None and isinstance(v, str):
@@ -18,22 +16,21 @@ class ProjectBase(BaseModel):
         return v
 
 
+class ProjectBase(ProjectSanitizeMixin):
+    """Base schema for Project."""
+    name: str = Field(..., min_length=1, max_length=200)
+    description: Optional[str] = Field(None, max_length=1000)
+
+
 class ProjectCreate(ProjectBase):
     """Schema for creating a new project."""
     pass
 
 
-class ProjectUpdate(BaseModel):
+class ProjectUpdate(ProjectSanitizeMixin):
     """Schema for updating project information."""
     name: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
-    
-    @field_validator('name', 'description')
-    @classmethod
-    def sanitize_fields(cls, v):
-        if v is not None and isinstance(v, str):
-            return sanitize_string(v)
-        return v
 
 
 class ProjectResponse(ProjectBase):
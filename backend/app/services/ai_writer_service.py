@@ -2,6 +2,7 @@
 Service de génération de documents de brevet avec Gemini 1.5 Pro.
 """
 
+import asyncio
 import google.generativeai as genai
 from typing import Optional, Dict, List
 import logging
@@ -78,9 +79,10 @@ class AIWriterService:
             # Parser le document généré
             parsed = self._parse_generated_document(raw_document)
             
-            # Appliquer linter si demandé
+            # Appliquer linter si demandé (CPU: exécuté hors de la boucle d'événements)
             if auto_lint:
-                lint_result = patent_linter.lint_document(
+                lint_result = await asyncio.to_thread(
+                    patent_linter.lint_document,
                     title=parsed['title'],
                     abstract=parsed['abstract'],
                     description=parsed['description'],
@@ -351,7 +353,8 @@ Retourne le document complet raffiné dans le même format.
         parsed = self._parse_generated_document(refined_text)
         
         # Appliquer linter
-        lint_result = patent_linter.lint_document(
+        lint_result = await asyncio.to_thread(
+            patent_linter.lint_document,
             title=parsed['title'],
             abstract=parsed['abstract'],
             description=parsed['description'],
@@ -5,8 +5,10 @@ Preuve d'antériorité sur la blockchain Bitcoin.
 
 import logging
 import hashlib
+import hmac
 import httpx
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, Optional
+from io import BytesIO
 from uuid import UUID, uuid4
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,6 +19,12 @@ from app.models.blockchain_anchor import BlockchainAnchor
 
 logger = logging.getLogger(__name__)
 
+# Taille des blocs lus pour le hachage de fichiers (1 MiB)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Taille des blocs envoyés lors du streaming du certificat PDF (64 KiB)
+CERTIFICATE_CHUNK_SIZE = 64 * 1024
+
 
 class BlockchainTimestampService:
     """
@@ -51,9 +59,7 @@ class BlockchainTimestampService:
         logger.info(f"Anchoring document for project {project_id}")
         
         # Calculate SHA-256 hash
-        doc_hash = hashlib.sha256(
-            document_content.encode('utf-8')
-        ).hexdigest()
+        doc_hash = self.calculate_hash(document_content)
         
         logger.info(f"Document hash: {doc_hash}")
         
@@ -184,16 +190,20 @@ class BlockchainTimestampService:
         self,
         anchor_id: UUID,
         db: AsyncSession
-    ) -> bytes:
+    ) -> AsyncIterator[bytes]:
         """
         Génère un certificat PDF de preuve d'antériorité.
         
+        Les vérifications (ancrage existant et confirmé) sont faites avant
+        de retourner l'itérateur, afin que les erreurs soient levées avant
+        le début de la réponse HTTP.
+        
         Args:
             anchor_id: ID de l'ancrage
             db: Database session
             
         Returns:
-            PDF bytes
+            Itérateur asynchrone sur les blocs du PDF
         """
         # Get anchor
         result = await db.execute(
@@ -209,8 +219,6 @@ class BlockchainTimestampService:
         
         # Generate PDF (simplified version)
         # TODO: Use reportlab for professional PDF
-        from io import BytesIO
-        
         pdf_content = f"""
         CERTIFICAT DE PREUVE D'ANTÉRIORITÉ
         
@@ -231,16 +239,36 @@ class BlockchainTimestampService:
         buffer.write(pdf_content.encode('utf-8'))
         buffer.seek(0)
         
-        return buffer.getvalue()
+        return self._iter_chunks(buffer)
+    
+    async def _iter_chunks(self, buffer: BytesIO) -> AsyncIterator[bytes]:
+        """Lit le buffer par blocs de CERTIFICATE_CHUNK_SIZE."""
+        while chunk := buffer.read(CERTIFICATE_CHUNK_SIZE):
+            yield chunk
     
     def calculate_hash(self, content: str) -> str:
         """Calcule le hash SHA-256 d'un contenu."""
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
     
+    async def calculate_file_hash(self, file) -> str:
+        """
+        Calcule le hash SHA-256 d'un fichier uploadé par blocs de 1 MiB.
+        
+        Args:
+            file: Fichier exposant une méthode async read(size) (ex: UploadFile)
+            
+        Returns:
+            Hash SHA-256 hexadécimal
+        """
+        hasher = hashlib.sha256()
+        while chunk := await file.read(HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+    
     def verify_hash(self, content: str, expected_hash: str) -> bool:
         """Vérifie qu'un contenu correspond à un hash."""
         actual_hash = self.calculate_hash(content)
-        return actual_hash == expected_hash
+        return hmac.compare_digest(actual_hash.encode(), expected_hash.encode())
 
 
 # Instance globale
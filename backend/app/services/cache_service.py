@@ -1,5 +1,5 @@
 import redis.asyncio as redis
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Union
 import json
 import logging
 from app.config import settings
@@ -15,6 +15,7 @@ class CacheService:
     
     def __init__(self):
         self._redis: Optional[redis.Redis] = None
+        self._redis_bytes: Optional[redis.Redis] = None
     
     async def _get_redis(self) -> redis.Redis:
         """Get or create Redis connection."""
@@ -34,6 +35,16 @@ class CacheService:
         
         return self._redis
     
+    async def _get_redis_bytes(self) -> redis.Redis:
+        """Get or create Redis connection without response decoding (binary payloads)."""
+        if self._redis_bytes is None:
+            self._redis_bytes = redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=False
+            )
+        
+        return self._redis_bytes
+    
     async def get(self, key: str) -> Optional[dict]:
         """
         Get value from cache.
@@ -219,11 +230,66 @@ class CacheService:
             logger.error(f"Cache clear_pattern error for pattern {pattern}: {e}")
             return 0
     
+    async def set_bytes(
+        self,
+        key: str,
+        value: Union[bytes, bytearray, memoryview],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Store raw bytes in cache (no JSON/base64 encoding).
+        
+        Args:
+            key: Cache key
+            value: Binary payload (bytes-like, not copied)
+            ttl: Time to live in seconds (default from settings)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            client = await self._get_redis_bytes()
+            ttl = ttl or settings.REDIS_CACHE_TTL
+            if isinstance(value, bytearray):
+                # redis-py only encodes bytes/memoryview: zero-copy view
+                value = memoryview(value)
+            await client.setex(key, ttl, value)
+            
+            logger.debug(f"Cache set_bytes for key: {key} ({len(value)} bytes, TTL: {ttl}s)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Cache set_bytes error for key {key}: {e}")
+            return False
+    
+    async def get_bytes(self, key: str, delete: bool = False) -> Optional[bytes]:
+        """
+        Get raw bytes from cache.
+        
+        Args:
+            key: Cache key
+            delete: Atomically delete the key after reading (GETDEL)
+            
+        Returns:
+            Cached bytes, or None if not found
+        """
+        try:
+            client = await self._get_redis_bytes()
+            if delete:
+                return await client.getdel(key)
+            return await client.get(key)
+            
+        except Exception as e:
+            logger.error(f"Cache get_bytes error for key {key}: {e}")
+            return None
+    
     async def close(self):
         """Close Redis connection."""
         if self._redis:
             await self._redis.close()
             logger.info("Redis cache connection closed")
+        if self._redis_bytes:
+            await self._redis_bytes.close()
 
 
 # Global instance
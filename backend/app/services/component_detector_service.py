@@ -3,6 +3,7 @@ Service de détection de composants avec SAM2 (Segment Anything Model 2).
 Détecte automatiquement tous les composants dans un schéma technique.
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Optional, Tuple
 import io
@@ -85,9 +86,8 @@ class ComponentDetectorService:
         """
         logger.info("Detecting components in image")
         
-        # Load image
-        img = Image.open(io.BytesIO(image_bytes))
-        img_array = np.array(img.convert('RGB'))
+        # Load image (décodage PIL hors event loop)
+        img_array = await asyncio.to_thread(self._decode_rgb, image_bytes)
         
         # Lazy load model
         self._lazy_load_model()
@@ -108,6 +108,11 @@ class ComponentDetectorService:
         logger.info(f"Detected {len(components_sorted)} components")
         return components_sorted
     
+    def _decode_rgb(self, image_bytes: bytes) -> np.ndarray:
+        """Décode l'image en tableau RGB."""
+        img = Image.open(io.BytesIO(image_bytes))
+        return np.array(img.convert('RGB'))
+    
     async def _detect_with_sam2(
         self,
         image_array: np.ndarray,
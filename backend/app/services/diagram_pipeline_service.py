@@ -3,11 +3,14 @@ Pipeline complet de traitement d'images techniques.
 Orchestrate: génération SDXL → vectorisation → détection → annotation.
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
 import io
+from blake3 import blake3
 
+from app.config import settings
 from app.services.image_generator_service import image_generator
 from app.services.vectorization_service import vectorizer
 from app.services.component_detector_service import component_detector
@@ -16,6 +19,55 @@ from app.services.annotation_service import annotator
 logger = logging.getLogger(__name__)
 
 
+class GenerationCoalescer:
+    """
+    Regroupe les générations SDXL identiques en cours d'exécution.
+    
+    La génération est déléguée à une API distante (Replicate / Stability AI)
+    qui traite une image de conditionnement par appel : un vrai batch GPU
+    n'est pas possible ici. On mutualise donc les requêtes identiques en vol
+    (même croquis + mêmes paramètres) sur un seul appel, et on borne le
+    nombre d'appels simultanés au provider.
+    """
+    
+    def __init__(self, max_concurrency: int):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def submit(self, key: Hashable, factory: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Exécute factory() ou attend le résultat d'un appel identique en cours.
+        
+        Args:
+            key: Clé de regroupement (hash du croquis + paramètres)
+            factory: Fonction retournant la coroutine de génération
+            
+        Returns:
+            Image générée (bytes)
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run(factory))
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        else:
+            logger.info("Coalescing identical in-flight diagram generation")
+        
+        # shield: l'annulation d'un client n'annule pas les autres en attente
+        return await asyncio.shield(future)
+    
+    async def _run(self, factory: Callable[[], Awaitable[bytes]]) -> bytes:
+        async with self._semaphore:
+            return await factory()
+    
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Marque l'exception comme récupérée si tous les clients sont partis
+            future.exception()
+
+
 class DiagramPipelineService:
     """
     Pipeline complet de traitement de schémas techniques.
@@ -33,6 +85,7 @@ class DiagramPipelineService:
         self.vectorizer = vectorizer
         self.detector = component_detector
         self.annotator = annotator
+        self.coalescer = GenerationCoalescer(settings.SD_MAX_CONCURRENT_REQUESTS)
         
         logger.info("DiagramPipelineService initialized")
     
@@ -45,7 +98,8 @@ class DiagramPipelineService:
         number_increment: int = 10,
         controlnet_strength: float = 0.8,
         add_leader_lines: bool = True,
-        custom_prompt: Optional[str] = None
+        custom_prompt: Optional[str] = None,
+        sketch_digest: Optional[bytes] = None
     ) -> Dict:
         """
         Pipeline complet de traitement de croquis.
@@ -59,6 +113,7 @@ class DiagramPipelineService:
             controlnet_strength: Force du ControlNet (0-1)
             add_leader_lines: Ajouter lignes de repère
             custom_prompt: Prompt personnalisé (optionnel)
+            sketch_digest: Digest BLAKE3 du croquis déjà calculé par l'appelant (optionnel)
             
         Returns:
             Dictionnaire avec SVG annoté, metadata, composants, labels
@@ -69,17 +124,26 @@ class DiagramPipelineService:
         
         # Step 1: Generate technical diagram with SDXL
         logger.info("Step 1/4: Generating technical diagram with SDXL + ControlNet")
-        diagram_bytes = await self.generator.generate_technical_diagram(
-            sketch_image=sketch_bytes,
-            diagram_type=diagram_type,
-            controlnet_strength=controlnet_strength,
-            custom_prompt=custom_prompt
+        generation_key = (
+            sketch_digest if sketch_digest is not None else blake3(sketch_bytes).digest(),
+            diagram_type,
+            controlnet_strength,
+            custom_prompt
+        )
+        diagram_bytes = await self.coalescer.submit(
+            generation_key,
+            lambda: self.generator.generate_technical_diagram(
+                sketch_image=sketch_bytes,
+                diagram_type=diagram_type,
+                controlnet_strength=controlnet_strength,
+                custom_prompt=custom_prompt
+            )
         )
         
         # Step 2: Vectorize to SVG
         logger.info("Step 2/4: Vectorizing diagram to SVG with Potrace")
-        svg_content = self.vectorizer.bitmap_to_svg(diagram_bytes)
-        svg_optimized = self.vectorizer.optimize_svg(svg_content)
+        svg_content = await self.vectorizer.bitmap_to_svg(diagram_bytes)
+        svg_optimized, _ = await self.vectorizer.optimize_svg(svg_content)
         
         # If no annotation, return early
         if not auto_annotate:
@@ -149,7 +213,7 @@ class DiagramPipelineService:
         image_bytes: bytes,
         threshold: int = 128,
         optimize: bool = True
-    ) -> str:
+    ) -> Tuple[str, bool]:
         """
         Vectorise une image sans génération ni annotation.
         
@@ -159,19 +223,20 @@ class DiagramPipelineService:
             optimize: Optimiser le SVG
             
         Returns:
-            Contenu SVG
+            (contenu SVG, optimisation effectivement appliquée)
         """
         logger.info("Vectorize-only mode")
         
-        svg_content = self.vectorizer.bitmap_to_svg(
+        svg_content = await self.vectorizer.bitmap_to_svg(
             image_bytes=image_bytes,
             threshold=threshold
         )
         
+        optimized = False
         if optimize:
-            svg_content = self.vectorizer.optimize_svg(svg_content)
+            svg_content, optimized = await self.vectorizer.optimize_svg(svg_content)
         
-        return svg_content
+        return svg_content, optimized
     
     async def annotate_existing_svg(
         self,
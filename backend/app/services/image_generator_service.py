@@ -3,6 +3,7 @@ Service de génération d'images techniques avec Stable Diffusion SDXL + Control
 Transforme des croquis en schémas techniques professionnels.
 """
 
+import asyncio
 import logging
 import io
 import base64
@@ -87,7 +88,7 @@ class ImageGeneratorService:
         logger.info(f"Generating {diagram_type} diagram with {self.provider}")
         
         # Prétraitement de l'image
-        preprocessed = self._preprocess_sketch(sketch_image)
+        preprocessed = await asyncio.to_thread(self._preprocess_sketch, sketch_image)
         
         # Choisir le prompt
         prompt = custom_prompt or TECHNICAL_DIAGRAM_PROMPTS.get(
@@ -165,8 +166,9 @@ class ImageGeneratorService:
             img_b64 = base64.b64encode(sketch_image).decode()
             data_uri = f"data:image/png;base64,{img_b64}"
             
-            # Run SDXL with ControlNet
-            output = replicate.run(
+            # Run SDXL with ControlNet (client synchrone : hors event loop)
+            output = await asyncio.to_thread(
+                replicate.run,
                 settings.SD_MODEL,
                 input={
                     "image": data_uri,
@@ -9,7 +9,6 @@ from datetime import date, timedelta
 from uuid import UUID
 import calendar
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from app.config import settings
 from app.models.project import Project
@@ -173,10 +172,7 @@ class INPIAnnuityCalculator:
             Liste des paiements à venir
         """
         # Get project
-        result = await db.execute(
-            select(Project).where(Project.id == project_id)
-        )
-        project = result.scalar_one_or_none()
+        project = await db.get(Project, project_id)
         
         if not project or not project.filing_date:
             return []
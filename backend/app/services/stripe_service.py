@@ -4,6 +4,7 @@ Checkout Sessions, Webhooks, et activation automatique des projets.
 """
 
 import logging
+import orjson
 import stripe
 from typing import Dict, Optional
 from uuid import UUID
@@ -149,13 +150,17 @@ class StripePaymentService:
         Returns:
             Status dict
         """
-        # Verify webhook signature
+        # Verify webhook signature, then parse the raw bytes with orjson
+        # (construct_event would json.loads + build nested StripeObjects).
+        # stripe-python signs "%d.%s" % (timestamp, payload): it needs str.
         try:
-            event = stripe.Webhook.construct_event(
-                payload,
+            stripe.WebhookSignature.verify_header(
+                payload.decode('utf-8'),
                 signature,
-                settings.STRIPE_WEBHOOK_SECRET
+                settings.STRIPE_WEBHOOK_SECRET,
+                tolerance=stripe.Webhook.DEFAULT_TOLERANCE
             )
+            event = orjson.loads(payload)
         except ValueError:
             logger.error("Invalid webhook payload")
             raise HTTPException(status_code=400, detail="Invalid payload")
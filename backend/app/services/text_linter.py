@@ -11,6 +11,13 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Try to import pyahocorasick (optional C extension for dictionary matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 class PatentSection(str, Enum):
     """Sections d'un document de brevet."""
@@ -182,18 +189,27 @@ class PatentTextLinter:
         Returns:
             Liste de tuples (adjectif, position)
         """
-        found = []
         text_lower = text.lower()
         
-        for adj in self.NON_TECHNICAL_ADJECTIVES:
-            # Recherche avec word boundaries pour éviter faux positifs
-            pattern = r'\b' + re.escape(adj) + r'\b'
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-            
-            for match in matches:
-                found.append((match.group(), match.start()))
-        
-        return found
+        if _NON_TECH_AUTOMATON is not None:
+            # Automate Aho-Corasick: un seul passage sur le texte
+            found = []
+            text_len = len(text_lower)
+            for end, adj in _NON_TECH_AUTOMATON.iter(text_lower):
+                start = end - len(adj) + 1
+                # Word boundaries pour éviter faux positifs
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if end + 1 < text_len and _is_word_char(text_lower[end + 1]):
+                    continue
+                found.append((adj, start))
+            return found
+        
+        # Repli: une seule regex précompilée (alternation avec word boundaries)
+        return [
+            (match.group(), match.start())
+            for match in _NON_TECH_PATTERN.finditer(text_lower)
+        ]
     
     def remove_non_technical_adjectives(
         self, 
@@ -383,7 +399,8 @@ class PatentTextLinter:
         title: str,
         abstract: str,
         description: str,
-        claims: str
+        claims: str,
+        non_tech_adjs: Optional[List[Tuple[str, int]]] = None
     ) -> QualityScore:
         """
         Calcule un score de qualité global pour le document.
@@ -393,6 +410,7 @@ class PatentTextLinter:
             abstract: Abrégé
             description: Description
             claims: Revendications
+            non_tech_adjs: Adjectifs non-techniques déjà détectés (évite un second balayage)
             
         Returns:
             Score de qualité détaillé
@@ -435,8 +453,9 @@ class PatentTextLinter:
         language_details = {}
         
         # Pénalité pour adjectifs non-techniques
-        full_text = f"{title} {abstract} {description} {claims}"
-        non_tech_adjs = self.find_non_technical_adjectives(full_text)
+        if non_tech_adjs is None:
+            full_text = f"{title} {abstract} {description} {claims}"
+            non_tech_adjs = self.find_non_technical_adjectives(full_text)
         adj_penalty = min(len(non_tech_adjs) * 5, 50)  # Max -50 points
         language_score -= adj_penalty
         language_details['non_technical_adjectives_found'] = len(non_tech_adjs)
@@ -542,6 +561,7 @@ class PatentTextLinter:
             'linted': {},
             'modifications': [],
             'validations': {},
+            'non_technical_adjectives': [],
             'quality_score': None
         }
         
@@ -587,12 +607,24 @@ class PatentTextLinter:
             )
         }
         
+        # Adjectifs non-techniques: un seul balayage du texte complet,
+        # réutilisé par le score de qualité
+        linted = result['linted']
+        full_text = " ".join((
+            linted['title'],
+            linted['abstract'],
+            linted['description'],
+            linted['claims']
+        ))
+        result['non_technical_adjectives'] = self.find_non_technical_adjectives(full_text)
+        
         # Score de qualité
         result['quality_score'] = self.calculate_quality_score(
-            result['linted']['title'],
-            result['linted']['abstract'],
-            result['linted']['description'],
-            result['linted']['claims']
+            linted['title'],
+            linted['abstract'],
+            linted['description'],
+            linted['claims'],
+            non_tech_adjs=result['non_technical_adjectives']
         )
         
         logger.info(
@@ -602,5 +634,25 @@ class PatentTextLinter:
         return result
 
 
+def _is_word_char(char: str) -> bool:
+    """Équivalent de \\w pour les word boundaries (Unicode)."""
+    return char.isalnum() or char == '_'
+
+
+# Dictionnaire d'adjectifs compilé une seule fois au chargement du module
+_NON_TECH_WORDS = sorted(set(PatentTextLinter.NON_TECHNICAL_ADJECTIVES), key=len, reverse=True)
+
+_NON_TECH_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(adj) for adj in _NON_TECH_WORDS) + r')\b'
+)
+
+_NON_TECH_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _NON_TECH_AUTOMATON = ahocorasick.Automaton()
+    for _adj in _NON_TECH_WORDS:
+        _NON_TECH_AUTOMATON.add_word(_adj, _adj)
+    _NON_TECH_AUTOMATON.make_automaton()
+
+
 # Instance globale
 patent_linter = PatentTextLinter()
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text
+from sqlalchemy import select, text, bindparam
 from app.models.patent import Patent
 from typing import List, Optional, Tuple
 from uuid import UUID
@@ -67,7 +67,11 @@ async def search_top_5_patents(
           AND (:project_id IS NULL OR p.project_id = :project_id)
         ORDER BY p.embedding <=> :query_embedding
         LIMIT 5
-    """)
+    """).bindparams(
+        # Typed bind: the Python list is serialised and sent as halfvec(384)
+        # (a plain list would not bind to a vector parameter)
+        bindparam("query_embedding", type_=Patent.embedding.type)
+    )
     
     # Execute query
     result = await db.execute(
@@ -3,15 +3,16 @@ Service de vectorisation d'images bitmap en SVG avec Potrace.
 Utilise le binaire potrace (CLI) ou pypotrace si disponible.
 """
 
+import asyncio
 import logging
 import io
-import subprocess
-import tempfile
 import os
-from typing import Optional
+from typing import Optional, Tuple
 from PIL import Image
 import numpy as np
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
+
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,18 @@ except ImportError:
     PYPOTRACE_AVAILABLE = False
     logger.warning("pypotrace not available, falling back to potrace CLI binary")
 
+SVG_NS = "http://www.w3.org/2000/svg"
+SVG_NSMAP = {None: SVG_NS}
+SVG_TAG = f"{{{SVG_NS}}}svg"
+PATH_TAG = f"{{{SVG_NS}}}path"
+
+# Supprime commentaires et blancs au parsing, pour un pretty_print propre
+SVG_CLEAN_PARSER = ET.XMLParser(remove_comments=True, remove_blank_text=True)
+SVG_PURGE_XPATH = ET.XPath(
+    "//svg:metadata | //svg:g[not(*)]",
+    namespaces={"svg": SVG_NS}
+)
+
 
 class VectorizationService:
     """
@@ -41,8 +54,13 @@ class VectorizationService:
             "opticurve": True,
             "opttolerance": 0.2
         }
+        self.cli_timeout = 60  # seconds
+        # Borne le nombre de tracés simultanés (CPU-bound)
+        self._semaphore = asyncio.Semaphore(
+            settings.POTRACE_CONCURRENCY or os.cpu_count() or 1
+        )
 
-    def bitmap_to_svg(
+    async def bitmap_to_svg(
         self,
         image_bytes: bytes,
         threshold: int = 128,
@@ -61,10 +79,12 @@ class VectorizationService:
         """
         logger.info("Starting bitmap to SVG vectorization")
 
-        if PYPOTRACE_AVAILABLE:
-            return self._vectorize_with_pypotrace(image_bytes, threshold, invert)
-        else:
-            return self._vectorize_with_cli(image_bytes, threshold, invert)
+        async with self._semaphore:
+            if PYPOTRACE_AVAILABLE:
+                return await asyncio.to_thread(
+                    self._vectorize_with_pypotrace, image_bytes, threshold, invert
+                )
+            return await self._vectorize_with_cli(image_bytes, threshold, invert)
 
     # ------------------------------------------------------------------
     # Backend 1: pypotrace C extension
@@ -77,16 +97,10 @@ class VectorizationService:
         invert: bool
     ) -> str:
         """Uses the pypotrace C extension."""
-        img = Image.open(io.BytesIO(image_bytes))
-        width, height = img.size
-
-        img_gray = img.convert('L')
-        img_bw = img_gray.point(lambda x: 255 if x > threshold else 0, '1')
+        gray = self._load_grayscale(image_bytes)
+        height, width = gray.shape
 
-        if invert:
-            img_bw = img_bw.point(lambda x: 255 - x)
-
-        bitmap_array = np.array(img_bw, dtype=bool)
+        bitmap_array = self._binarize(gray, threshold, above=not invert)
 
         bmp = pypotrace.Bitmap(bitmap_array)
         path = bmp.trace(
@@ -105,7 +119,7 @@ class VectorizationService:
     # Backend 2: potrace CLI binary
     # ------------------------------------------------------------------
 
-    def _vectorize_with_cli(
+    async def _vectorize_with_cli(
         self,
         image_bytes: bytes,
         threshold: int,
@@ -113,59 +127,58 @@ class VectorizationService:
     ) -> str:
         """
         Uses the system 'potrace' binary (already installed in Docker image).
-        Converts image → PBM temp file → runs potrace → reads SVG output.
+        PBM is piped to potrace's stdin and the SVG read from its stdout,
+        without touching the filesystem.
         """
-        img = Image.open(io.BytesIO(image_bytes))
-        width, height = img.size
-
-        # Convert to grayscale then binarise
-        img_gray = img.convert('L')
-        img_bw = img_gray.point(lambda x: 255 if x > threshold else 0, '1')
-
-        if invert:
-            img_bw = img_bw.point(lambda x: 255 - x)
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pbm_path = os.path.join(tmpdir, "input.pbm")
-            svg_path = os.path.join(tmpdir, "output.svg")
-
-            # Save as PBM (binary bitmap), which potrace reads natively
-            img_bw.save(pbm_path)
-
-            # Build potrace command
-            cmd = [
-                "potrace",
-                pbm_path,
-                "--svg",
-                "--output", svg_path,
-                "--turdsize", str(self.default_params["turdsize"]),
-                "--alphamax", str(self.default_params["alphamax"]),
-                "--opttolerance", str(self.default_params["opttolerance"]),
-            ]
-
-            if not self.default_params["opticurve"]:
-                cmd.append("--longcurve")
-
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                    check=True
-                )
-            except FileNotFoundError:
-                logger.error("potrace binary not found. Returning placeholder SVG.")
-                return self._placeholder_svg(width, height)
-            except subprocess.CalledProcessError as e:
-                logger.error(f"potrace failed: {e.stderr}")
-                return self._placeholder_svg(width, height)
-            except subprocess.TimeoutExpired:
-                logger.error("potrace timed out. Returning placeholder SVG.")
-                return self._placeholder_svg(width, height)
-
-            with open(svg_path, "r", encoding="utf-8") as f:
-                svg_content = f.read()
+        # Décodage PIL + seuillage hors event loop
+        pbm_bytes, width, height = await asyncio.to_thread(
+            self._prepare_pbm, image_bytes, threshold, invert
+        )
+
+        # Build potrace command ("-" = stdin / stdout)
+        cmd = [
+            "potrace",
+            "-",
+            "--svg",
+            "--output", "-",
+            "--turdsize", str(self.default_params["turdsize"]),
+            "--alphamax", str(self.default_params["alphamax"]),
+            "--opttolerance", str(self.default_params["opttolerance"]),
+        ]
+
+        if not self.default_params["opticurve"]:
+            cmd.append("--longcurve")
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                process_group=0
+            )
+        except FileNotFoundError:
+            logger.error("potrace binary not found. Returning placeholder SVG.")
+            return self._placeholder_svg(width, height)
+
+        try:
+            svg_bytes, stderr = await asyncio.wait_for(
+                proc.communicate(pbm_bytes), timeout=self.cli_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error("potrace timed out. Returning placeholder SVG.")
+            return self._placeholder_svg(width, height)
+        finally:
+            # Timeout ou annulation de la requête : ne pas laisser de potrace orphelin
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+        if proc.returncode != 0:
+            logger.error(f"potrace failed: {stderr.decode(errors='replace')}")
+            return self._placeholder_svg(width, height)
+
+        svg_content = svg_bytes.decode("utf-8")
 
         logger.info(f"Vectorization (CLI) complete: {len(svg_content)} bytes SVG")
         return svg_content
@@ -174,6 +187,40 @@ class VectorizationService:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _load_grayscale(self, image_bytes: bytes) -> np.ndarray:
+        """Décode l'image en niveaux de gris (uint8, shape = (height, width))."""
+        img = Image.open(io.BytesIO(image_bytes))
+        # convert('L') copie même une image déjà en niveaux de gris
+        if img.mode != 'L':
+            img = img.convert('L')
+        return np.asarray(img, dtype=np.uint8)
+
+    def _binarize(self, gray: np.ndarray, threshold: int, above: bool) -> np.ndarray:
+        """
+        Seuillage vectorisé (une seule passe NumPy, sans LUT PIL).
+
+        Returns:
+            Masque bool: gray > threshold si above, sinon gray <= threshold
+        """
+        return gray > threshold if above else gray <= threshold
+
+    def _prepare_pbm(self, image_bytes: bytes, threshold: int, invert: bool):
+        """Décode + binarise l'image pour le CLI. Returns (pbm_bytes, width, height)."""
+        gray = self._load_grayscale(image_bytes)
+        height, width = gray.shape
+
+        # PBM: bit 1 = noir = pixel à tracer
+        foreground = self._binarize(gray, threshold, above=invert)
+        return self._to_pbm(foreground), width, height
+
+    def _to_pbm(self, mask: np.ndarray) -> bytes:
+        """Encode un masque bool en PBM binaire (P4), lignes paddées à l'octet."""
+        height, width = mask.shape
+        # bitorder='big' : pixel le plus à gauche = bit de poids fort (format P4)
+        # join sur le buffer NumPy : une seule copie (pas de tobytes() intermédiaire)
+        header = b"P4\n%d %d\n" % (width, height)
+        return b"".join((header, np.packbits(mask, axis=1, bitorder='big')))
+
     def _placeholder_svg(self, width: int, height: int) -> str:
         """Returns a minimal valid empty SVG as a last-resort fallback."""
         return (
@@ -186,51 +233,58 @@ class VectorizationService:
         """
         Convertit Potrace path (pypotrace) en SVG.
         """
-        svg = ET.Element('svg', {
-            'xmlns': 'http://www.w3.org/2000/svg',
+        svg = ET.Element(SVG_TAG, {
             'width': str(width),
             'height': str(height),
             'viewBox': f'0 0 {width} {height}',
             'version': '1.1'
-        })
+        }, nsmap=SVG_NSMAP)
 
         for curve in path:
-            path_data = []
-
+            # Un token par segment, formaté en une seule opération '%'
+            # (%g : plus rapide que les f-strings sur les floats)
             start_point = curve.start_point
-            path_data.append(f'M {start_point.x},{start_point.y}')
+            path_data = ['M %g,%g' % (start_point.x, start_point.y)]
 
             for segment in curve.segments:
+                end = segment.end_point
                 if segment.is_corner:
                     c = segment.c
-                    path_data.append(f'L {c.x},{c.y}')
-                    end = segment.end_point
-                    path_data.append(f'L {end.x},{end.y}')
+                    path_data.append('L %g,%g L %g,%g' % (c.x, c.y, end.x, end.y))
                 else:
                     c1 = segment.c1
                     c2 = segment.c2
-                    end = segment.end_point
                     path_data.append(
-                        f'C {c1.x},{c1.y} {c2.x},{c2.y} {end.x},{end.y}'
+                        'C %g,%g %g,%g %g,%g' % (c1.x, c1.y, c2.x, c2.y, end.x, end.y)
                     )
 
             path_data.append('Z')
 
-            path_elem = ET.Element('path', {
+            ET.SubElement(svg, PATH_TAG, {
                 'd': ' '.join(path_data),
                 'fill': 'black',
                 'stroke': 'none'
             })
-            svg.append(path_elem)
 
         return ET.tostring(svg, encoding='unicode')
 
-    def optimize_svg(self, svg_content: str) -> str:
+    async def optimize_svg(self, svg_content: str) -> Tuple[str, bool]:
         """
         Optimise SVG pour réduire taille et améliorer qualité.
 
-        Uses scour if available, otherwise basic optimization.
+        Ignoré sous SVG_OPTIMIZE_MIN_BYTES (gain négligeable) ; sinon exécuté
+        dans un thread pour ne pas bloquer l'event loop.
+
+        Returns:
+            (svg, optimisation effectivement appliquée)
         """
+        if len(svg_content) < settings.SVG_OPTIMIZE_MIN_BYTES:
+            return svg_content, False
+
+        return await asyncio.to_thread(self._optimize_svg_sync, svg_content), True
+
+    def _optimize_svg_sync(self, svg_content: str) -> str:
+        """Uses scour if available, otherwise basic optimization."""
         try:
             import scour.scour
 
@@ -252,31 +306,16 @@ class VectorizationService:
             return self._basic_svg_optimization(svg_content)
 
     def _basic_svg_optimization(self, svg_content: str) -> str:
-        """Basic SVG optimization without scour."""
-        root = ET.fromstring(svg_content)
-
-        for elem in root.iter():
-            if elem.tag is ET.Comment:
-                root.remove(elem)
-
-        self._indent_xml(root)
-        return ET.tostring(root, encoding='unicode')
-
-    def _indent_xml(self, elem, level=0):
-        """Add indentation to XML for readability."""
-        indent = "\n" + "  " * level
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = indent + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = indent
-            for child in elem:
-                self._indent_xml(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = indent
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = indent
+        """
+        Basic SVG optimization without scour (en C via libxml2): commentaires,
+        <metadata> et <g> vides supprimés, puis indentation.
+        """
+        root = ET.fromstring(svg_content.encode('utf-8'), SVG_CLEAN_PARSER)
+
+        for elem in SVG_PURGE_XPATH(root):
+            elem.getparent().remove(elem)
+
+        return ET.tostring(root, encoding='unicode', pretty_print=True)
 
 
 # Global instance
@@ -0,0 +1,4 @@
+"""En-têtes HTTP de cache partagés par les routers."""
+
+# Réponses statiques (contenu constant par déploiement): cache navigateur/CDN d'une heure
+STATIC_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600"}
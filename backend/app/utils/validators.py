@@ -46,8 +46,13 @@ class PasswordValidator:
         return password
 
 
+# Null bytes and control characters (tab, LF and CR are kept), built once
+_SANITIZE_TABLE = dict.fromkeys([
+    *range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F
+])
+
+
 def sanitize_string(value: str) -> str:
     """Sanitize string input by removing potentially harmful characters."""
-    # Remove null bytes and control characters
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', value)
-    return sanitized.strip()
+    # Remove null bytes and control characters (single C pass, no regex)
+    return value.translate(_SANITIZE_TABLE).strip()
@@ -0,0 +1,63 @@
+"""
+Apply Alembic migrations (release step).
+
+Databases initialised by Base.metadata.create_all have no alembic_version
+table, so "alembic upgrade head" would fail on 001 ("relation already
+exists"). They are stamped first:
+- schema from the pre-Alembic models (no projects.filing_date) -> 001_initial
+- schema from the current models (dev create_all)              -> head
+then upgraded to head.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+
+logger = logging.getLogger("migrate")
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+
+
+def _stamp_target(sync_conn) -> Optional[str]:
+    """Revision to stamp an unversioned create_all database with (None = nothing to do)."""
+    inspector = inspect(sync_conn)
+    if inspector.has_table("alembic_version") or not inspector.has_table("users"):
+        return None
+
+    project_columns = {col["name"] for col in inspector.get_columns("projects")}
+    return "head" if "filing_date" in project_columns else "001_initial"
+
+
+async def _detect_stamp_target() -> Optional[str]:
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        async with engine.connect() as conn:
+            return await conn.run_sync(_stamp_target)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    config = Config(ALEMBIC_INI)
+
+    # env.py runs its own event loop: inspect first, then call Alembic
+    stamp_target = asyncio.run(_detect_stamp_target())
+    if stamp_target:
+        logger.info(f"Unversioned create_all schema detected, stamping {stamp_target}")
+        command.stamp(config, stamp_target)
+
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    main()
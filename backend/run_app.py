@@ -1,11 +1,18 @@
 import os
 import uvicorn
 
+from migrate import main as run_migrations
+
 if __name__ == "__main__":
     # Get port from environment variable or default to 8000
     # This bypasses shell expansion issues in Docker/Railway
     port = int(os.environ.get("PORT", 8000))
     
+    # Apply Alembic migrations first: the Docker CMD (Railway, Hostinger) has no
+    # release phase, and outside dev the app no longer runs create_all
+    if os.environ.get("RUN_MIGRATIONS", "true").lower() != "false":
+        run_migrations()
+    
     print(f"Starting PatentFlow Backend on port {port}")
     
     # Run Uvicorn programmatically
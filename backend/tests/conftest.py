@@ -2,8 +2,9 @@ import pytest
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from httpx import AsyncClient
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, get_db, get_db_ro
 from app.config import settings
+from app.dependencies import get_current_user
 
 
 # Test database URL (use a separate test database)
@@ -40,6 +41,21 @@ async def client(db_session):
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_ro] = override_get_db
+    
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        yield ac
+    
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def api_client():
+    """Client de test sans base de données (utilisateur authentifié simulé)."""
+    async def override_get_current_user():
+        return {"id": "test-user", "email": "user@test.com"}
+    
+    app.dependency_overrides[get_current_user] = override_get_current_user
     
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
@@ -0,0 +1,82 @@
+import hashlib
+import io
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from app.services import blockchain_service as blockchain_module
+from app.services.blockchain_service import blockchain_service
+
+
+DOCUMENT = bytes(range(256)) * 4099 + "Procédé".encode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096, 1024 * 1024])
+async def test_file_hash_matches_one_shot_hash(monkeypatch, chunk_size):
+    """Le hash par blocs est identique au hash en une passe, quelle que soit la taille de bloc."""
+    monkeypatch.setattr(blockchain_module, "HASH_CHUNK_SIZE", chunk_size)
+    # Petits blocs : document tronqué (dernier bloc partiel), sinon plusieurs blocs de 1 MiB
+    data = DOCUMENT if chunk_size >= 4096 else DOCUMENT[:chunk_size * 150 + 3]
+
+    digest = await blockchain_service.calculate_file_hash(UploadFile(io.BytesIO(data)))
+
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_calculate_file_hash_endpoint(api_client):
+    response = await api_client.post(
+        "/api/blockchain/calculate-hash/file",
+        files={"file": ("brevet.pdf", DOCUMENT, "application/pdf")}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "hash": hashlib.sha256(DOCUMENT).hexdigest(),
+        "algorithm": "SHA-256"
+    }
+
+@pytest.mark.asyncio
+async def test_verify_hash_match(api_client):
+    content = "Procédé de torréfaction"
+    expected = blockchain_service.calculate_hash(content)
+
+    response = await api_client.post(
+        "/api/blockchain/verify-hash",
+        params={"content": content, "expected_hash": expected}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["valid"] is True
+    assert data["actual_hash"] == expected
+
+
+@pytest.mark.asyncio
+async def test_verify_hash_mismatch(api_client):
+    response = await api_client.post(
+        "/api/blockchain/verify-hash",
+        params={"content": "original", "expected_hash": "0" * 64}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["valid"] is False
+    assert data["actual_hash"] == blockchain_service.calculate_hash("original")
+
+
+@pytest.mark.asyncio
+async def test_verify_hash_non_ascii_expected_hash(api_client):
+    """Un hash attendu non-ASCII est simplement invalide (pas de 500)."""
+    response = await api_client.post(
+        "/api/blockchain/verify-hash",
+        params={"content": "original", "expected_hash": "é" * 64}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["valid"] is False
+
+
+def test_verify_content_hash_non_ascii():
+    assert blockchain_service.verify_hash("original", "é" * 64) is False
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.database import engine, get_db, get_db_ro
+
+
+@pytest.fixture(autouse=True)
+async def dispose_engine():
+    """Connexions du pool liées à l'event loop du test : libérées après chaque test."""
+    yield
+    await engine.dispose()
+
+
+async def _session(dependency):
+    generator = dependency()
+    return generator, await generator.__anext__()
+
+
+async def _close(generator):
+    with pytest.raises(StopAsyncIteration):
+        await generator.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_get_db_ro_rejects_writes():
+    generator, session = await _session(get_db_ro)
+
+    assert await session.scalar(text("SELECT 1")) == 1
+    with pytest.raises(DBAPIError, match="read-only transaction"):
+        await session.execute(text("CREATE TABLE read_only_probe (id integer)"))
+
+    await _close(generator)
+
+
+@pytest.mark.asyncio
+async def test_read_only_flag_does_not_leak_to_writers():
+    generator, session = await _session(get_db_ro)
+    assert await session.scalar(text("SHOW transaction_read_only")) == "on"
+    await _close(generator)
+
+    # Même connexion du pool réutilisée par get_db : de nouveau en lecture/écriture
+    generator, session = await _session(get_db)
+    assert await session.scalar(text("SHOW transaction_read_only")) == "off"
+    await _close(generator)
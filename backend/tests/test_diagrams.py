@@ -0,0 +1,281 @@
+import io
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pybase64
+import pytest
+from blake3 import blake3
+from PIL import Image
+
+from app.config import get_settings
+from app.dependencies import get_current_user
+from app.main import app
+from app.services.cache_service import cache_service
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    """Remplace le cache Redis binaire par un dict en mémoire."""
+    store = {}
+
+    async def set_bytes(key, value, ttl=None):
+        store[key] = bytes(value)
+        return True
+
+    async def get_bytes(key, delete=False):
+        return store.pop(key, None) if delete else store.get(key)
+
+    monkeypatch.setattr(cache_service, "set_bytes", set_bytes)
+    monkeypatch.setattr(cache_service, "get_bytes", get_bytes)
+    return store
+
+
+def _sketch_png() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("L", (8, 8), color=255).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _pipeline_result() -> dict:
+    return {
+        "svg_content": "<svg/>",
+        "diagram_image": b"\x89PNG diagram",
+        "components": [
+            {"id": 0, "bbox": [1, 2, 30, 40], "area": 1200, "type": "unknown"}
+        ],
+        "labels": [
+            {"number": 10, "position": [15, 2], "component_id": 0, "has_leader_line": False}
+        ],
+        "processing_time_ms": 42,
+        "auto_annotated": True,
+        "quality_metrics": {"num_components_detected": 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_generate_diagram_result_cache_miss_then_hit(api_client, fake_cache):
+    sketch = _sketch_png()
+    payload = {
+        "sketch_image": pybase64.b64encode_as_string(sketch),
+        "diagram_type": "mechanical",
+    }
+
+    with patch(
+        "app.services.diagram_pipeline_service.diagram_pipeline.process_sketch",
+        new_callable=AsyncMock
+    ) as mock_process:
+        mock_process.return_value = _pipeline_result()
+
+        miss = await api_client.post("/api/diagrams/generate", json=payload)
+        hit = await api_client.post("/api/diagrams/generate", json=payload)
+
+    assert miss.status_code == 200
+    assert hit.status_code == 200
+    mock_process.assert_awaited_once()
+    # Digest calculé une fois par le router et réutilisé pour la coalescence
+    assert mock_process.await_args.kwargs["sketch_digest"] == blake3(sketch).digest()
+    assert any(key.startswith("diagram:result:") for key in fake_cache)
+
+    for data in (miss.json(), hit.json()):
+        assert data["svg_content"] == "<svg/>"
+        assert data["components"] == [
+            {"id": 0, "bbox": [1, 2, 30, 40], "area": 1200, "type": "unknown"}
+        ]
+        assert data["labels"] == [
+            {"number": 10, "position": [15, 2], "component_id": 0, "has_leader_line": False}
+        ]
+        assert data["diagram_image_url"].startswith("data:image/png;base64,")
+
+
+@pytest.mark.asyncio
+async def test_generate_diagram_cache_key_depends_on_parameters(api_client, fake_cache):
+    sketch_b64 = pybase64.b64encode_as_string(_sketch_png())
+
+    with patch(
+        "app.services.diagram_pipeline_service.diagram_pipeline.process_sketch",
+        new_callable=AsyncMock
+    ) as mock_process:
+        mock_process.return_value = _pipeline_result()
+
+        for diagram_type in ("mechanical", "electrical"):
+            response = await api_client.post(
+                "/api/diagrams/generate",
+                json={"sketch_image": sketch_b64, "diagram_type": diagram_type}
+            )
+            assert response.status_code == 200
+
+    assert mock_process.await_count == 2
+
+
+def _opencv_result() -> dict:
+    # Valeurs telles que renvoyées par OpenCV/SAM2 (floats, scalaires numpy)
+    result = _pipeline_result()
+    result["components"] = [
+        {"id": np.int64(0), "bbox": [1.0, np.int32(2), 30.0, 40.0], "area": 1200.5,
+         "type": "unknown"}
+    ]
+    result["labels"] = [
+        {"number": 10, "position": (15.6, 2.2), "component_id": np.int64(0),
+         "has_leader_line": np.bool_(False)}
+    ]
+    return result
+
+
+@pytest.mark.asyncio
+async def test_generate_diagram_casts_detector_values_to_int(api_client, fake_cache):
+    payload = {"sketch_image": pybase64.b64encode_as_string(_sketch_png())}
+
+    with patch(
+        "app.services.diagram_pipeline_service.diagram_pipeline.process_sketch",
+        new_callable=AsyncMock
+    ) as mock_process:
+        mock_process.return_value = _opencv_result()
+
+        miss = await api_client.post("/api/diagrams/generate", json=payload)
+        hit = await api_client.post("/api/diagrams/generate", json=payload)
+
+    # Types natifs : le résultat est aussi sérialisable par msgpack (cache hit)
+    mock_process.assert_awaited_once()
+    for response in (miss, hit):
+        assert response.status_code == 200
+        data = response.json()
+        assert data["components"] == _pipeline_result()["components"]
+        assert data["labels"] == _pipeline_result()["labels"]
+
+
+@pytest.mark.asyncio
+async def test_annotate_svg_casts_label_values_to_int(api_client):
+    with patch(
+        "app.services.diagram_pipeline_service.diagram_pipeline.annotate_existing_svg",
+        new_callable=AsyncMock
+    ) as mock_annotate:
+        mock_annotate.return_value = {
+            "svg_content": "<svg/>",
+            "labels": _opencv_result()["labels"],
+            "num_components": np.int64(1),
+        }
+
+        response = await api_client.post(
+            "/api/diagrams/annotate",
+            json={
+                "svg_content": "<svg/>",
+                "reference_image": pybase64.b64encode_as_string(_sketch_png())
+            }
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "svg_content": "<svg/>",
+        "labels": _pipeline_result()["labels"],
+        "num_components": 1
+    }
+
+
+@pytest.mark.asyncio
+async def test_upload_sketch_keeps_base64_contract(api_client, fake_cache):
+    sketch = _sketch_png()
+
+    response = await api_client.post(
+        "/api/diagrams/upload",
+        files={"file": ("sketch.png", sketch, "image/png")}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "filename": "sketch.png",
+        "content_type": "image/png",
+        "size_bytes": len(sketch),
+        "base64_image": pybase64.b64encode_as_string(sketch)
+    }
+    assert not fake_cache
+
+
+@pytest.mark.asyncio
+async def test_upload_sketch_rejects_non_image(api_client, fake_cache):
+    response = await api_client.post(
+        "/api/diagrams/upload",
+        files={"file": ("notes.txt", b"hello", "text/plain")}
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_upload_sketch_rejects_oversized_file(api_client, fake_cache, monkeypatch):
+    monkeypatch.setattr(get_settings(), "SKETCH_UPLOAD_MAX_BYTES", 16)
+
+    response = await api_client.post(
+        "/api/diagrams/upload",
+        files={"file": ("sketch.png", _sketch_png(), "image/png")}
+    )
+
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_upload_sketch_stream_stores_raw_bytes(api_client, fake_cache):
+    sketch = _sketch_png()
+
+    response = await api_client.post(
+        "/api/diagrams/upload/stream",
+        files={"file": ("sketch.png", sketch, "image/png")}
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert set(data) == {
+        "upload_id", "filename", "content_type", "size_bytes", "sha", "expires_in"
+    }
+    assert data["size_bytes"] == len(sketch)
+    assert data["sha"] == blake3(sketch).hexdigest()
+    assert fake_cache[f"sketch:{data['upload_id']}"] == sketch
+
+
+@pytest.mark.asyncio
+async def test_diagram_result_url_is_owner_only(api_client, fake_cache):
+    payload = {
+        "sketch_image": pybase64.b64encode_as_string(_sketch_png()),
+        "return_image_url": True
+    }
+
+    with patch(
+        "app.services.diagram_pipeline_service.diagram_pipeline.process_sketch",
+        new_callable=AsyncMock
+    ) as mock_process:
+        mock_process.return_value = _pipeline_result()
+        generated = await api_client.post("/api/diagrams/generate", json=payload)
+
+    image_url = generated.json()["diagram_image_url"]
+    assert image_url.startswith("/api/diagrams/result/")
+
+    owner = await api_client.get(image_url)
+    assert owner.status_code == 200
+    assert owner.content == _pipeline_result()["diagram_image"]
+
+    app.dependency_overrides[get_current_user] = lambda: {"id": "other-user"}
+    assert (await api_client.get(image_url)).status_code == 404
+
+    del app.dependency_overrides[get_current_user]
+    assert (await api_client.get(image_url)).status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("svg_size,expected", [(64, False), (4096, True)])
+async def test_vectorize_reports_whether_optimization_ran(
+    api_client, monkeypatch, svg_size, expected
+):
+    monkeypatch.setattr(get_settings(), "SVG_OPTIMIZE_MIN_BYTES", 1024)
+    svg = '<svg xmlns="http://www.w3.org/2000/svg"><!-- ' + "x" * svg_size + " --></svg>"
+
+    with patch(
+        "app.services.vectorization_service.vectorizer.bitmap_to_svg",
+        new_callable=AsyncMock
+    ) as mock_trace:
+        mock_trace.return_value = svg
+        response = await api_client.post(
+            "/api/diagrams/vectorize",
+            json={"image": pybase64.b64encode_as_string(_sketch_png()), "optimize": True}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["optimization_applied"] is expected
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from app.services.diagram_pipeline_service import GenerationCoalescer
+
+
+class _Factory:
+    """Factory de génération contrôlable : compte les appels, bloque jusqu'à release()."""
+
+    def __init__(self, result: bytes = b"png", error: Exception = None):
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+        self.result = result
+        self.error = error
+        self._gate = asyncio.Event()
+
+    def release(self) -> None:
+        self._gate.set()
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self._gate.wait()
+            if self.error is not None:
+                raise self.error
+            return self.result
+        finally:
+            self.running -= 1
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_identical_submits_share_one_factory_call():
+    coalescer = GenerationCoalescer(max_concurrency=4)
+    factory = _Factory()
+
+    waiters = [asyncio.create_task(coalescer.submit("k", factory)) for _ in range(5)]
+    await _settle()
+    factory.release()
+
+    assert await asyncio.gather(*waiters) == [b"png"] * 5
+    assert factory.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    coalescer = GenerationCoalescer(max_concurrency=4)
+    factory = _Factory()
+
+    waiters = [asyncio.create_task(coalescer.submit(key, factory)) for key in ("a", "b", "c")]
+    await _settle()
+    factory.release()
+    await asyncio.gather(*waiters)
+
+    assert factory.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_factory_exception_reaches_every_waiter():
+    coalescer = GenerationCoalescer(max_concurrency=4)
+    factory = _Factory(error=RuntimeError("provider down"))
+
+    waiters = [asyncio.create_task(coalescer.submit("k", factory)) for _ in range(3)]
+    await _settle()
+    factory.release()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert factory.calls == 1
+    assert all(isinstance(r, RuntimeError) and str(r) == "provider down" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_key_is_forgotten_so_retry_runs_fresh():
+    coalescer = GenerationCoalescer(max_concurrency=4)
+    failing = _Factory(error=RuntimeError("provider down"))
+    failing.release()
+
+    with pytest.raises(RuntimeError):
+        await coalescer.submit("k", failing)
+    await _settle()
+    assert "k" not in coalescer._inflight
+
+    retry = _Factory(result=b"retry")
+    retry.release()
+    assert await coalescer.submit("k", retry) == b"retry"
+    assert retry.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_others():
+    coalescer = GenerationCoalescer(max_concurrency=4)
+    factory = _Factory()
+
+    first = asyncio.create_task(coalescer.submit("k", factory))
+    second = asyncio.create_task(coalescer.submit("k", factory))
+    await _settle()
+    first.cancel()
+    factory.release()
+
+    assert await second == b"png"
+    assert first.cancelled()
+    assert factory.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    coalescer = GenerationCoalescer(max_concurrency=2)
+    factory = _Factory()
+
+    waiters = [asyncio.create_task(coalescer.submit(i, factory)) for i in range(5)]
+    await _settle()
+    assert factory.running == 2
+    factory.release()
+    await asyncio.gather(*waiters)
+
+    assert factory.calls == 5
+    assert factory.max_running == 2
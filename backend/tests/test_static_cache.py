@@ -0,0 +1,22 @@
+import pytest
+
+
+STATIC_ENDPOINTS = [
+    "/api/diagrams/types",
+    "/api/payments/pricing",
+    "/api/ai/modes",
+    "/api/annuities/rates",
+    "/api/annuities/costs?years=20",
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", STATIC_ENDPOINTS)
+async def test_static_endpoints_are_cacheable(api_client, path):
+    """Les réponses constantes portent un Cache-Control public d'une heure."""
+    response = await api_client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.json()
@@ -0,0 +1,170 @@
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import orjson
+import pytest
+import stripe
+from fastapi import HTTPException
+
+from app.config import settings
+from app.database import get_db
+from app.main import app
+from app.models.payment import Payment
+from app.services.stripe_service import stripe_service
+
+
+WEBHOOK_SECRET = "whsec_test_secret"
+
+
+@pytest.fixture(autouse=True)
+def webhook_secret(monkeypatch):
+    monkeypatch.setattr(settings, "STRIPE_WEBHOOK_SECRET", WEBHOOK_SECRET)
+
+
+def _signature_header(payload: bytes, secret: str = WEBHOOK_SECRET) -> str:
+    timestamp = int(time.time())
+    signature = stripe.WebhookSignature._compute_signature(
+        f"{timestamp}.{payload.decode('utf-8')}", secret
+    )
+    return f"t={timestamp},v1={signature}"
+
+
+def _event(event_type: str, obj: dict) -> bytes:
+    return orjson.dumps({"id": "evt_test", "type": event_type, "data": {"object": obj}})
+
+
+def _fake_db(row=None):
+    """Session factice : execute() renvoie row via scalar_one_or_none()."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = row
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_checkout_completed_updates_project_and_records_payment():
+    project_id, user_id = uuid4(), uuid4()
+    project = SimpleNamespace()
+    db = _fake_db(project)
+    payload = _event("checkout.session.completed", {
+        "id": "cs_test_123",
+        "amount_total": 29900,
+        "currency": "eur",
+        "payment_intent": "pi_test_123",
+        "payment_method_types": ["card"],
+        "metadata": {
+            "project_id": str(project_id),
+            "user_id": str(user_id),
+            "patent_type": "provisional"
+        }
+    })
+
+    result = await stripe_service.handle_webhook(payload, _signature_header(payload), db)
+
+    assert result == {"status": "success", "event_type": "checkout.session.completed"}
+    assert project.payment_status == "paid"
+    assert project.stripe_session_id == "cs_test_123"
+    assert project.amount_paid == 29900
+    payment = db.add.call_args.args[0]
+    assert isinstance(payment, Payment)
+    assert payment.project_id == project_id
+    assert payment.user_id == user_id
+    assert payment.stripe_payment_intent_id == "pi_test_123"
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("event_type,expected_status", [
+    ("payment_intent.succeeded", "succeeded"),
+    ("payment_intent.payment_failed", "failed"),
+])
+async def test_payment_intent_events_update_payment(event_type, expected_status):
+    payment = SimpleNamespace(status="pending")
+    db = _fake_db(payment)
+    payload = _event(event_type, {"id": "pi_test_123"})
+
+    result = await stripe_service.handle_webhook(payload, _signature_header(payload), db)
+
+    assert result["event_type"] == event_type
+    assert payment.status == expected_status
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unhandled_event_type_is_acknowledged():
+    db = _fake_db()
+    payload = _event("customer.created", {"id": "cus_test"})
+
+    result = await stripe_service.handle_webhook(payload, _signature_header(payload), db)
+
+    assert result == {"status": "success", "event_type": "customer.created"}
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("header", [
+    "t=0,v1=deadbeef",
+    "not-a-stripe-header",
+])
+async def test_bad_signature_is_rejected(header):
+    db = _fake_db()
+    payload = _event("payment_intent.succeeded", {"id": "pi_test_123"})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await stripe_service.handle_webhook(payload, header, db)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Invalid signature"
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_signature_from_other_secret_is_rejected():
+    payload = _event("payment_intent.succeeded", {"id": "pi_test_123"})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await stripe_service.handle_webhook(
+            payload, _signature_header(payload, secret="whsec_other"), _fake_db()
+        )
+
+    assert exc_info.value.detail == "Invalid signature"
+
+
+@pytest.mark.asyncio
+async def test_invalid_json_maps_to_400():
+    payload = b"{not json"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await stripe_service.handle_webhook(payload, _signature_header(payload), _fake_db())
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Invalid payload"
+
+
+@pytest.mark.asyncio
+async def test_non_utf8_payload_maps_to_400():
+    with pytest.raises(HTTPException) as exc_info:
+        await stripe_service.handle_webhook(b"\xff\xfe", "t=0,v1=deadbeef", _fake_db())
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Invalid payload"
+
+
+@pytest.mark.asyncio
+async def test_webhook_endpoint_rejects_bad_signature(api_client):
+    app.dependency_overrides[get_db] = lambda: _fake_db()
+
+    missing = await api_client.post("/api/payments/webhook", content=b"{}")
+    forged = await api_client.post(
+        "/api/payments/webhook",
+        content=_event("payment_intent.succeeded", {"id": "pi_test_123"}),
+        headers={"stripe-signature": "t=0,v1=deadbeef"}
+    )
+
+    assert missing.status_code == 400
+    assert forged.status_code == 400
+    assert forged.json()["detail"] == "Invalid signature"
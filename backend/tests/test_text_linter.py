@@ -0,0 +1,51 @@
+import re
+
+import pytest
+
+from app.services import text_linter
+from app.services.text_linter import PatentTextLinter, patent_linter
+
+
+SAMPLE_TEXTS = [
+    "",
+    "Un dispositif de fixation comprenant une vis et un écrou.",
+    "Un système EXCELLENT, simple et Très Efficace: excellente solution!",
+    "Des résultats merveilleux, merveilleux et meilleurs que les meilleures.",
+    "parfaitement excellent2 _idéal idéal_ supérieures-inférieur (optimal).",
+    "Magnifique\nmagnifiques\tformidables; incroyable... évident? évidentes",
+]
+
+
+def _reference(text: str):
+    """Ancienne recherche mot par mot (liste dédoublonnée), triée par position."""
+    found = []
+    for adj in set(PatentTextLinter.NON_TECHNICAL_ADJECTIVES):
+        pattern = r'\b' + re.escape(adj) + r'\b'
+        for match in re.finditer(pattern, text.lower()):
+            found.append((match.group(), match.start()))
+    return sorted(found, key=lambda item: item[1])
+
+
+@pytest.mark.parametrize("text", SAMPLE_TEXTS)
+def test_regex_fallback_matches_per_word_search(monkeypatch, text):
+    monkeypatch.setattr(text_linter, "_NON_TECH_AUTOMATON", None)
+
+    assert patent_linter.find_non_technical_adjectives(text) == _reference(text)
+
+
+@pytest.mark.skipif(not text_linter.AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed")
+@pytest.mark.parametrize("text", SAMPLE_TEXTS)
+def test_automaton_matches_per_word_search(text):
+    assert text_linter._NON_TECH_AUTOMATON is not None
+
+    assert patent_linter.find_non_technical_adjectives(text) == _reference(text)
+
+
+def test_duplicate_dictionary_entry_counted_once(monkeypatch):
+    """'merveilleux' figure deux fois dans la liste mais n'est compté qu'une fois."""
+    assert PatentTextLinter.NON_TECHNICAL_ADJECTIVES.count("merveilleux") == 2
+    monkeypatch.setattr(text_linter, "_NON_TECH_AUTOMATON", None)
+
+    assert patent_linter.find_non_technical_adjectives("Un effet merveilleux.") == [
+        ("merveilleux", 9)
+    ]
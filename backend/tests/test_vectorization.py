@@ -0,0 +1,105 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.config import settings
+from app.services.vectorization_service import vectorizer
+
+
+def _png(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(array, mode="L").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _pil_pbm(image_bytes: bytes, threshold: int, invert: bool) -> bytes:
+    """Ancien chemin PIL : point() en mode '1' puis sauvegarde PBM."""
+    img_gray = Image.open(io.BytesIO(image_bytes)).convert("L")
+    img_bw = img_gray.point(lambda x: 255 if x > threshold else 0, "1")
+    if invert:
+        img_bw = img_bw.point(lambda x: 255 - x)
+    buffer = io.BytesIO()
+    img_bw.save(buffer, format="PPM")
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("width,height", [(16, 5), (13, 7), (1, 1), (33, 2)])
+@pytest.mark.parametrize("invert", [False, True])
+def test_pbm_matches_pil_path(width, height, invert):
+    """PBM NumPy (packbits, lignes paddées) identique octet par octet à PIL."""
+    rng = np.random.default_rng(width * height)
+    image_bytes = _png(rng.integers(0, 256, (height, width), dtype=np.uint8))
+
+    pbm_bytes, pbm_width, pbm_height = vectorizer._prepare_pbm(image_bytes, 128, invert)
+
+    assert (pbm_width, pbm_height) == (width, height)
+    assert pbm_bytes == _pil_pbm(image_bytes, 128, invert)
+
+
+@pytest.mark.parametrize("invert", [False, True])
+def test_binarize_matches_pil_point(invert):
+    """Masque NumPy identique à l'ancien point(lambda x: ...) PIL (bit noir = à tracer)."""
+    rng = np.random.default_rng(0)
+    image_bytes = _png(rng.integers(0, 256, (9, 11), dtype=np.uint8))
+
+    img_bw = Image.open(io.BytesIO(image_bytes)).convert("L").point(
+        lambda x: 255 if x > 128 else 0, "1"
+    )
+    if invert:
+        img_bw = img_bw.point(lambda x: 255 - x)
+    expected = ~np.array(img_bw, dtype=bool)
+
+    gray = vectorizer._load_grayscale(image_bytes)
+    assert (vectorizer._binarize(gray, 128, above=invert) == expected).all()
+
+
+def test_binarize_threshold_boundary():
+    gray = np.array([[0, 127, 128, 129, 255]], dtype=np.uint8)
+
+    assert vectorizer._binarize(gray, 128, above=False).tolist() == [
+        [True, True, True, False, False]
+    ]
+    assert vectorizer._binarize(gray, 128, above=True).tolist() == [
+        [False, False, False, True, True]
+    ]
+
+
+def test_load_grayscale_converts_rgb():
+    rgb = Image.new("RGB", (3, 2), color=(255, 0, 0))
+    buffer = io.BytesIO()
+    rgb.save(buffer, format="PNG")
+
+    gray = vectorizer._load_grayscale(buffer.getvalue())
+
+    assert gray.shape == (2, 3)
+    assert gray.dtype == np.uint8
+    assert (gray == np.asarray(rgb.convert("L"))).all()
+
+
+def _svg(size: int) -> str:
+    """SVG valide d'environ size octets (commentaire de remplissage)."""
+    head = '<svg xmlns="http://www.w3.org/2000/svg"><!-- '
+    tail = ' --><path d="M 0,0 L 1,1"/></svg>'
+    return head + "x" * max(size - len(head) - len(tail), 0) + tail
+
+
+@pytest.mark.asyncio
+async def test_optimize_svg_skips_small_svg(monkeypatch):
+    monkeypatch.setattr(settings, "SVG_OPTIMIZE_MIN_BYTES", 1024)
+    svg = _svg(512)
+
+    assert await vectorizer.optimize_svg(svg) == (svg, False)
+
+
+@pytest.mark.asyncio
+async def test_optimize_svg_runs_at_threshold(monkeypatch):
+    monkeypatch.setattr(settings, "SVG_OPTIMIZE_MIN_BYTES", 1024)
+    svg = _svg(1024)
+
+    optimized, applied = await vectorizer.optimize_svg(svg)
+
+    assert applied is True
+    assert "<!--" not in optimized
+    assert len(optimized) < len(svg)